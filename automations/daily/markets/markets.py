@@ -5,29 +5,97 @@ Displays price data for tracked cryptocurrencies and stocks.
 """
 
 import argparse
+import asyncio
+import gzip
+import hashlib
 import json
+import math
+import os
+import random
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple
 
-import requests
-import yfinance as yf
+import httpx
 from colorama import Fore, Style, init as colorama_init
-from tabulate import tabulate
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+# yfinance (and the pandas/numpy stack it pulls in) and tabulate are imported
+# lazily so --show-config, --crypto-only and --json don't pay for them
+if TYPE_CHECKING:
+    import numpy as np
 
 # Path constants
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 CONFIG_DIR = REPO_ROOT / ".config"
 DATA_DIR = REPO_ROOT / ".data"
 LOGS_DIR = DATA_DIR / "logs"
+CACHE_DIR = DATA_DIR / "cache"
 WATCHLIST_PATH = CONFIG_DIR / "watchlist.json"
 
+# Watchlist stock categories, in display order, with their section headings
+STOCK_CATEGORIES = ("index_funds", "etfs", "individual")
+STOCK_CATEGORY_LABELS = {
+    "index_funds": "STOCKS - INDEX FUNDS",
+    "etfs": "STOCKS - ETFS",
+    "individual": "STOCKS - INDIVIDUAL"
+}
+
 # API constants
 COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
 
+# Trading-day lookbacks for 24h / 7d / 3mo / 1yr changes
+CHANGE_OFFSETS = (1, 5, 63, 252)
+
+# CoinGecko free tier allows ~30 req/min; stay under it
+COINGECKO_RATE_PER_MIN = 25
+
+# Watchlists at least this large use the Numba kernel for % changes (when installed)
+NUMBA_MIN_TICKERS = 200
+
+# Parallel yfinance download shards (Yahoo throttles beyond ~4-6 per IP)
+STOCK_DOWNLOAD_SHARDS = 4
+
+# Retry constants (seconds)
+MAX_ATTEMPTS = 6
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30
+
+# Log compression level (zstd)
+LOG_ZSTD_LEVEL = 3
+
+# Cache constants
+DEFAULT_CACHE_TTL = 300  # seconds
+
+
+class Table(NamedTuple):
+    """Raw table: headers plus rows of unformatted cells."""
+    headers: list[str]
+    rows: list[list["Cell"]]
+
+
+# A cell is either literal text or a (kind, value) pair formatted at render time,
+# where kind is one of "price", "quantity", "dollars" or "change"
+Cell = str | tuple[str, float | None]
+BriefingItem = str | Table | list[Cell]
+
 
 class APIError(Exception):
     """Base exception for API errors."""
@@ -41,48 +109,159 @@ def load_watchlist() -> dict[str, Any]:
         print(f"Create a watchlist.json file with your assets.")
         sys.exit(1)
 
-    with open(WATCHLIST_PATH) as f:
-        return json.load(f)
+    return _read_watchlist(WATCHLIST_PATH, WATCHLIST_PATH.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _read_watchlist(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse the watchlist, memoized on (path, mtime) so edits are picked up."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks until a request slot is available."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping if the bucket is empty."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 1
+            self.tokens -= 1
+
+
+_BUCKET = TokenBucket(rate=COINGECKO_RATE_PER_MIN / 60.0, capacity=COINGECKO_RATE_PER_MIN)
+
+
+class ResponseCache:
+    """On-disk cache for API responses, stored as gzipped JSON with a TTL."""
+
+    def __init__(self, cache_dir: Path, ttl: float = DEFAULT_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, endpoint: str, params: dict | None) -> Path:
+        """Build the cache file path for an endpoint + params combination."""
+        key_source = endpoint + _dumps(sorted((params or {}).items()))
+        key = hashlib.md5(key_source.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json.gz"
+
+    def get(self, endpoint: str, params: dict | None) -> Any | None:
+        """Return the cached payload, or None if missing or expired."""
+        path = self._path(endpoint, params)
+        try:
+            with gzip.open(path, "rb") as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("ts", 0) >= self.ttl:
+            return None
+        return entry.get("payload")
+
+    def set(self, endpoint: str, params: dict | None, payload: Any) -> None:
+        """Store a payload, writing atomically so readers never see partial files."""
+        path = self._path(endpoint, params)
+        temp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(temp_path, "wt") as f:
+                f.write(_dumps({"ts": time.time(), "payload": payload}))
+            os.replace(temp_path, path)
+        except OSError:
+            # Caching is best-effort; a failed write just means a miss next run
+            pass
 
 
 class CryptoFetcher:
     """Handles CoinGecko API interactions."""
 
-    def __init__(self):
+    def __init__(self, cache: ResponseCache | None = None):
         self.base_url = COINGECKO_API_BASE
-        self.session = requests.Session()
+        # HTTP/2 lets concurrent endpoint calls share one connection; retries are handled in _request
+        self.client = httpx.Client(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            headers={
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "markets/1.0"
+            }
+        )
+        self.cache = cache
 
     def _request(self, endpoint: str, params: dict = None) -> dict:
-        """Make API request with retry logic."""
+        """Make API request with retry logic, serving from cache when fresh."""
+        if self.cache:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                return cached
+
         url = f"{self.base_url}{endpoint}"
 
-        for attempt in range(3):
+        for attempt in range(MAX_ATTEMPTS):
+            last_attempt = attempt == MAX_ATTEMPTS - 1
+            _BUCKET.acquire()
             try:
-                response = self.session.get(url, params=params, timeout=10)
+                response = self.client.get(url, params=params)
 
-                if response.status_code == 429:
-                    time.sleep(5 * (attempt + 1))
-                    continue
+                # Throttled or transient server error - back off and retry
+                if response.status_code == 429 or response.status_code >= 500:
+                    if not last_attempt:
+                        self._sleep_backoff(attempt, response)
+                        continue
 
                 response.raise_for_status()
-                return response.json()
-
-            except requests.exceptions.Timeout:
-                if attempt < 2:
-                    time.sleep(1)
+                try:
+                    payload = _loads(response.content)
+                except ValueError as e:
+                    raise APIError(f"Invalid JSON response: {e}")
+                if self.cache:
+                    self.cache.set(endpoint, params, payload)
+                return payload
+
+            except httpx.TimeoutException:
+                if not last_attempt:
+                    self._sleep_backoff(attempt)
                     continue
                 raise APIError("Request timed out")
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 raise APIError(f"API request failed: {e}")
 
         raise APIError("Max retries exceeded")
 
+    @staticmethod
+    def _sleep_backoff(attempt: int, response: httpx.Response | None = None) -> None:
+        """Sleep with exponential backoff and full jitter, honoring Retry-After."""
+        retry_after = 0.0
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 0))
+            except ValueError:
+                # Retry-After may also be an HTTP date; fall back to jitter alone
+                pass
+        delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+        time.sleep(max(retry_after, delay))
+
     def fetch_prices(self, coins: list[dict]) -> list[dict]:
         """Fetch current prices and changes for cryptocurrencies."""
         if not coins:
             return []
 
-        coin_ids = [c["id"] for c in coins]
+        # Sorted so the request (and its cache key) doesn't depend on watchlist order
+        coin_ids = sorted(c["id"] for c in coins)
 
         # Fetch all data in a single batched request - includes all timeframes
         market_data = self._request("/coins/markets", {
@@ -130,94 +309,175 @@ class CryptoFetcher:
         return results
 
 
+def _make_pct_changes_kernel(prange):
+    """Build the % change kernel around a loop range (numba.prange or range).
+
+    The kernel fills out[k, j] with the % change of ticker j over offsets[k]
+    trading days. It is written as plain loops so Numba can compile it; the
+    range is a closure variable so nothing at module scope is rebound.
+    """
+    def pct_changes_kernel(closes, offsets, out):
+        n_rows = closes.shape[0]
+        for j in prange(closes.shape[1]):
+            last = closes[n_rows - 1, j]
+            for k in range(offsets.shape[0]):
+                d = offsets[k]
+                if d < n_rows:
+                    historical = closes[n_rows - 1 - d, j]
+                    out[k, j] = (last - historical) / historical * 100.0
+                else:
+                    out[k, j] = math.nan
+
+    return pct_changes_kernel
+
+
+@lru_cache(maxsize=1)
+def _numba_pct_changes():
+    """Compile the % change kernel with Numba, or return None if it isn't installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # error_model="numpy" so a zero close yields inf/NaN like the NumPy path instead of raising
+    return numba.njit(parallel=True, cache=True, error_model="numpy")(
+        _make_pct_changes_kernel(numba.prange)
+    )
+
+
 class StockFetcher:
     """Handles Yahoo Finance interactions via yfinance."""
 
+    def __init__(self):
+        # yfinance-cache persists price history on disk and only fetches new bars;
+        # fall back to plain yfinance when it isn't installed
+        try:
+            import yfinance_cache as yf
+            yf.yfc_cache_manager.SetCacheDirpath(str(CACHE_DIR / "yfc"))
+        except ImportError:
+            import yfinance as yf
+        self.yf = yf
+
     def fetch_prices(self, stocks: list[dict]) -> list[dict]:
         """Fetch stock data using yfinance with batch downloading."""
         if not stocks:
             return []
 
+        import numpy as np
+
         tickers = [s["ticker"] for s in stocks]
         ticker_to_name = {s["ticker"]: s["name"] for s in stocks}
-        all_stocks = stocks  # Store reference for holdings lookup
-
-        # Batch download all tickers at once - much faster than individual requests
-        # Use 2y to ensure we have enough data for 1yr calculations (need 253+ trading days)
-        hist = yf.download(tickers, period="2y", group_by="ticker", progress=False)
+        ticker_to_holdings = {s["ticker"]: s.get("holdings") for s in stocks}
+
+        # (days x tickers) close matrix, forward-filled so each column's last row is its latest close
+        closes = self._download_closes(tickers)
+        if closes is None:
+            return [
+                {"ticker": t, "name": ticker_to_name[t], "error": "No data available"}
+                for t in tickers
+            ]
+
+        # Calculate all changes for all tickers at once; offsets beyond the history stay NaN
+        offsets = np.array(CHANGE_OFFSETS)
+        last = closes[-1]
+        pct = np.empty((len(offsets), len(tickers)))
+        kernel = _numba_pct_changes() if len(tickers) >= NUMBA_MIN_TICKERS else None
+        if kernel:
+            kernel(closes, offsets, pct)
+        else:
+            pct.fill(np.nan)
+            available = offsets < len(closes)
+            historical = closes[-(offsets[available] + 1)]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pct[available] = (last - historical) / historical * 100
 
         results = []
-        for ticker in tickers:
-            try:
-                # Handle single vs multiple ticker DataFrame structure
-                if len(tickers) == 1:
-                    ticker_hist = hist
-                else:
-                    ticker_hist = hist[ticker]
-
-                # Check if we have data
-                if ticker_hist.empty or ticker_hist["Close"].isna().all():
-                    results.append({
-                        "ticker": ticker,
-                        "name": ticker_to_name[ticker],
-                        "error": "No data available"
-                    })
-                    continue
-
-                # Drop NaN values for accurate calculations
-                close_prices = ticker_hist["Close"].dropna()
-                if close_prices.empty:
-                    results.append({
-                        "ticker": ticker,
-                        "name": ticker_to_name[ticker],
-                        "error": "No data available"
-                    })
-                    continue
-
-                current_price = close_prices.iloc[-1]
-
-                # Calculate changes
-                change_24h = self._calc_change(close_prices, 1, current_price)
-                change_7d = self._calc_change(close_prices, 5, current_price)  # 5 trading days
-                change_3mo = self._calc_change(close_prices, 63, current_price)  # ~63 trading days
-                change_1yr = self._calc_change(close_prices, 252, current_price)  # ~252 trading days
-
-                result = {
-                    "ticker": ticker,
-                    "name": ticker_to_name[ticker],
-                    "price": current_price,
-                    "change_24h": change_24h,
-                    "change_7d": change_7d,
-                    "change_3mo": change_3mo,
-                    "change_1yr": change_1yr
-                }
-
-                # Add portfolio metrics if holdings data exists
-                # Find the original stock dict to get holdings
-                stock_dict = next((s for s in all_stocks if s["ticker"] == ticker), None)
-                if stock_dict and stock_dict.get("holdings"):
-                    result["portfolio_metrics"] = PortfolioCalculator.calculate_holding_metrics(
-                        current_price, stock_dict["holdings"]
-                    )
-
-                results.append(result)
-
-            except Exception as e:
+        for i, ticker in enumerate(tickers):
+            if np.isnan(last[i]):
                 results.append({
                     "ticker": ticker,
                     "name": ticker_to_name[ticker],
-                    "error": str(e)
+                    "error": "No data available"
                 })
+                continue
+
+            current_price = float(last[i])
+            change_24h, change_7d, change_3mo, change_1yr = (
+                None if np.isnan(value) else float(value) for value in pct[:, i]
+            )
+
+            result = {
+                "ticker": ticker,
+                "name": ticker_to_name[ticker],
+                "price": current_price,
+                "change_24h": change_24h,
+                "change_7d": change_7d,
+                "change_3mo": change_3mo,
+                "change_1yr": change_1yr
+            }
+
+            # Add portfolio metrics if holdings data exists
+            holdings = ticker_to_holdings[ticker]
+            if holdings:
+                result["portfolio_metrics"] = PortfolioCalculator.calculate_holding_metrics(
+                    current_price, holdings
+                )
+
+            results.append(result)
 
         return results
 
-    def _calc_change(self, close_prices, days_back: int, current: float) -> float | None:
-        """Calculate percentage change from days_back to current."""
-        if len(close_prices) <= days_back:
+
+    def _download_closes(self, tickers: list[str]) -> "np.ndarray | None":
+        """Download close history in parallel shards as one forward-filled (days x tickers) array.
+
+        Each shard's DataFrame is converted to arrays straight away; aligning the
+        shards and forward-filling happen in NumPy rather than pandas.
+        """
+        import numpy as np
+
+        groups = [g for g in (tickers[i::STOCK_DOWNLOAD_SHARDS] for i in range(STOCK_DOWNLOAD_SHARDS)) if g]
+
+        def download(group: list[str]) -> tuple["np.ndarray", list[str], "np.ndarray"] | None:
+            # Use 2y to ensure we have enough data for 1yr calculations (need 253+ trading days).
+            # With yfinance-cache, only bars newer than the last run are fetched
+            hist = self.yf.download(group, period="2y", group_by="column", progress=False, threads=False)
+            if hist.empty:
+                return None
+            close_frame = hist["Close"]
+            if close_frame.ndim == 1:
+                close_frame = close_frame.to_frame(group[0])
+            return (
+                close_frame.index.to_numpy(),
+                list(close_frame.columns),
+                close_frame.to_numpy(dtype=np.float64)
+            )
+
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            shards = [shard for shard in executor.map(download, groups) if shard is not None]
+
+        if not shards:
             return None
 
-        historical = close_prices.iloc[-(days_back + 1)]
-        return ((current - historical) / historical) * 100
+        # Shards usually share a trading calendar; only build a union of dates when they don't
+        dates = shards[0][0]
+        for shard_dates, _, _ in shards[1:]:
+            if not np.array_equal(shard_dates, dates):
+                dates = np.union1d(dates, shard_dates)
+
+        column_index = {ticker: j for j, ticker in enumerate(tickers)}
+        closes = np.full((len(dates), len(tickers)), np.nan)
+        for shard_dates, columns, values in shards:
+            rows = np.searchsorted(dates, shard_dates)
+            for k, column in enumerate(columns):
+                j = column_index.get(column)
+                if j is not None:
+                    closes[rows, j] = values[:, k]
+
+        # Forward-fill: for each cell, take the most recent row at or above it holding a value
+        last_valid = np.where(np.isnan(closes), 0, np.arange(len(dates))[:, None])
+        np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+        return closes[last_valid, np.arange(len(tickers))]
 
 
 class PortfolioCalculator:
@@ -266,13 +526,29 @@ class PortfolioCalculator:
         """
         total_value = 0
         total_cost = 0
+        num_holdings = 0
 
         for asset in assets_data:
             metrics = asset.get('portfolio_metrics')
             if metrics:
                 total_value += metrics['current_value']
                 total_cost += metrics['total_cost']
+                num_holdings += 1
+
+        return PortfolioCalculator._build_totals(total_value, total_cost, num_holdings)
 
+    @staticmethod
+    def combine_portfolio_totals(totals_list: list[dict]) -> dict:
+        """Combine per-section totals into grand totals without re-walking assets."""
+        return PortfolioCalculator._build_totals(
+            sum(t['total_value'] for t in totals_list),
+            sum(t['total_cost'] for t in totals_list),
+            sum(t['num_holdings'] for t in totals_list)
+        )
+
+    @staticmethod
+    def _build_totals(total_value: float, total_cost: float, num_holdings: int) -> dict:
+        """Derive gain/loss figures from summed value and cost."""
         total_gain_loss_dollars = total_value - total_cost
         total_gain_loss_percent = (total_gain_loss_dollars / total_cost * 100) if total_cost > 0 else 0
 
@@ -281,14 +557,19 @@ class PortfolioCalculator:
             'total_cost': total_cost,
             'total_gain_loss_dollars': total_gain_loss_dollars,
             'total_gain_loss_percent': total_gain_loss_percent,
-            'num_holdings': sum(1 for a in assets_data if a.get('portfolio_metrics'))
+            'num_holdings': num_holdings
         }
 
 
 class OutputFormatter:
-    """Handles terminal and file output formatting."""
+    """Handles terminal and file output formatting.
+
+    The format_* helpers are pure functions of their arguments, so results are
+    memoized across the terminal and log rendering passes.
+    """
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_change(value: float | None, colored: bool = True) -> str:
         """Format change with optional color."""
         if value is None:
@@ -307,6 +588,7 @@ class OutputFormatter:
         return formatted
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_price(value: float) -> str:
         """Format price with appropriate precision."""
         if value >= 1000:
@@ -317,6 +599,7 @@ class OutputFormatter:
             return f"${value:.4f}"
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_dollars(value: float, colored: bool = True) -> str:
         """Format dollar amounts with sign and optional color."""
         prefix = "+" if value > 0 else ""
@@ -332,6 +615,7 @@ class OutputFormatter:
         return formatted
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_quantity(value: float) -> str:
         """Format quantity with appropriate precision."""
         if value >= 1:
@@ -339,142 +623,160 @@ class OutputFormatter:
         else:
             return f"{value:.6f}"
 
-    def create_crypto_table(self, data: list[dict], colored: bool = True, show_portfolio: bool = False) -> str:
-        """Create formatted table for crypto data."""
-        if show_portfolio:
-            headers = ["Symbol", "Price", "Qty", "Value", "Gain/Loss $", "Gain/Loss %"]
-        else:
-            headers = ["Symbol", "Price", "24h", "7d", "30d", "1yr"]
-
+    def render_cell(self, cell: "Cell", colored: bool = True) -> str:
+        """Render a raw cell; strings pass through, (kind, value) pairs are formatted."""
+        if isinstance(cell, str):
+            return cell
+
+        kind, value = cell
+        if kind == "price":
+            return self.format_price(value)
+        if kind == "quantity":
+            return self.format_quantity(value)
+        if kind == "dollars":
+            return self.format_dollars(value, colored)
+        return self.format_change(value, colored)
+
+    def build_rows(
+        self,
+        data: list[dict],
+        label_key: str,
+        change_keys: list[str],
+        show_portfolio: bool = False,
+        portfolio_totals: dict | None = None
+    ) -> list[list["Cell"]]:
+        """Build raw table rows (unformatted numeric cells) for crypto or stock data.
+
+        portfolio_totals may be passed in when the caller already computed them.
+        """
         rows = []
-        portfolio_totals = None
 
         for item in data:
             if "error" in item:
-                if show_portfolio:
-                    rows.append([item["symbol"], f"Error: {item['error']}", "-", "-", "-", "-"])
-                else:
-                    rows.append([item["symbol"], f"Error: {item['error']}", "-", "-", "-", "-"])
-            else:
-                if show_portfolio:
-                    metrics = item.get("portfolio_metrics")
-                    if metrics:
-                        rows.append([
-                            item["symbol"],
-                            self.format_price(item["price"]),
-                            self.format_quantity(metrics["quantity"]),
-                            self.format_price(metrics["current_value"]),
-                            self.format_dollars(metrics["gain_loss_dollars"], colored),
-                            self.format_change(metrics["gain_loss_percent"], colored)
-                        ])
-                else:
+                rows.append([item[label_key], f"Error: {item['error']}", "-", "-", "-", "-"])
+            elif show_portfolio:
+                metrics = item.get("portfolio_metrics")
+                if metrics:
                     rows.append([
-                        item["symbol"],
-                        self.format_price(item["price"]),
-                        self.format_change(item["change_24h"], colored),
-                        self.format_change(item["change_7d"], colored),
-                        self.format_change(item["change_30d"], colored),
-                        self.format_change(item["change_1yr"], colored)
+                        item[label_key],
+                        ("price", item["price"]),
+                        ("quantity", metrics["quantity"]),
+                        ("price", metrics["current_value"]),
+                        ("dollars", metrics["gain_loss_dollars"]),
+                        ("change", metrics["gain_loss_percent"])
                     ])
+            else:
+                rows.append([item[label_key], ("price", item["price"])] + [
+                    ("change", item[key]) for key in change_keys
+                ])
 
         # Add totals row if showing portfolio
         if show_portfolio and rows:
-            portfolio_totals = PortfolioCalculator.calculate_portfolio_totals(data)
+            if portfolio_totals is None:
+                portfolio_totals = PortfolioCalculator.calculate_portfolio_totals(data)
             if portfolio_totals['num_holdings'] > 0:
                 rows.append(["-" * 6] * 6)  # Separator
                 rows.append([
                     "TOTAL",
                     "",
                     "",
-                    self.format_price(portfolio_totals["total_value"]),
-                    self.format_dollars(portfolio_totals["total_gain_loss_dollars"], colored),
-                    self.format_change(portfolio_totals["total_gain_loss_percent"], colored)
+                    ("price", portfolio_totals["total_value"]),
+                    ("dollars", portfolio_totals["total_gain_loss_dollars"]),
+                    ("change", portfolio_totals["total_gain_loss_percent"])
                 ])
 
-        return tabulate(rows, headers=headers, tablefmt="simple")
+        return rows
 
-    def create_stock_table(self, data: list[dict], colored: bool = True, show_portfolio: bool = False) -> str:
-        """Create formatted table for stock data."""
+    def render_table(self, table: "Table", colored: bool = True) -> str:
+        """Render raw rows into a tabulate table."""
+        from tabulate import tabulate
+
+        rows = [[self.render_cell(cell, colored) for cell in row] for row in table.rows]
+        return tabulate(rows, headers=table.headers, tablefmt="simple")
+
+    def build_crypto_table(
+        self, data: list[dict], show_portfolio: bool = False, portfolio_totals: dict | None = None
+    ) -> "Table":
+        """Build the raw table for crypto data."""
+        if show_portfolio:
+            headers = ["Symbol", "Price", "Qty", "Value", "Gain/Loss $", "Gain/Loss %"]
+        else:
+            headers = ["Symbol", "Price", "24h", "7d", "30d", "1yr"]
+        change_keys = ["change_24h", "change_7d", "change_30d", "change_1yr"]
+        return Table(headers, self.build_rows(data, "symbol", change_keys, show_portfolio, portfolio_totals))
+
+    def build_stock_table(
+        self, data: list[dict], show_portfolio: bool = False, portfolio_totals: dict | None = None
+    ) -> "Table":
+        """Build the raw table for stock data."""
         if show_portfolio:
             headers = ["Ticker", "Price", "Qty", "Value", "Gain/Loss $", "Gain/Loss %"]
         else:
             headers = ["Ticker", "Price", "24h", "7d", "3mo", "1yr"]
+        change_keys = ["change_24h", "change_7d", "change_3mo", "change_1yr"]
+        return Table(headers, self.build_rows(data, "ticker", change_keys, show_portfolio, portfolio_totals))
 
-        rows = []
-
-        for item in data:
-            if "error" in item:
-                if show_portfolio:
-                    rows.append([item["ticker"], f"Error: {item['error']}", "-", "-", "-", "-"])
-                else:
-                    rows.append([item["ticker"], f"Error: {item['error']}", "-", "-", "-", "-"])
-            else:
-                if show_portfolio:
-                    metrics = item.get("portfolio_metrics")
-                    if metrics:
-                        rows.append([
-                            item["ticker"],
-                            self.format_price(item["price"]),
-                            self.format_quantity(metrics["quantity"]),
-                            self.format_price(metrics["current_value"]),
-                            self.format_dollars(metrics["gain_loss_dollars"], colored),
-                            self.format_change(metrics["gain_loss_percent"], colored)
-                        ])
-                else:
-                    rows.append([
-                        item["ticker"],
-                        self.format_price(item["price"]),
-                        self.format_change(item["change_24h"], colored),
-                        self.format_change(item["change_7d"], colored),
-                        self.format_change(item["change_3mo"], colored),
-                        self.format_change(item["change_1yr"], colored)
-                    ])
-
-        # Add totals row if showing portfolio
-        if show_portfolio and rows:
-            portfolio_totals = PortfolioCalculator.calculate_portfolio_totals(data)
-            if portfolio_totals['num_holdings'] > 0:
-                rows.append(["-" * 6] * 6)  # Separator
-                rows.append([
-                    "TOTAL",
-                    "",
-                    "",
-                    self.format_price(portfolio_totals["total_value"]),
-                    self.format_dollars(portfolio_totals["total_gain_loss_dollars"], colored),
-                    self.format_change(portfolio_totals["total_gain_loss_percent"], colored)
-                ])
+    def create_crypto_table(self, data: list[dict], colored: bool = True, show_portfolio: bool = False) -> str:
+        """Create formatted table for crypto data."""
+        return self.render_table(self.build_crypto_table(data, show_portfolio), colored)
 
-        return tabulate(rows, headers=headers, tablefmt="simple")
+    def create_stock_table(self, data: list[dict], colored: bool = True, show_portfolio: bool = False) -> str:
+        """Create formatted table for stock data."""
+        return self.render_table(self.build_stock_table(data, show_portfolio), colored)
 
 
 class BriefingLogger:
-    """Handles log file output."""
+    """Handles log file output.
 
-    def __init__(self):
+    Logs are zstd-compressed (markets-YYYY-MM-DD.log.zst) unless compress is
+    False or zstandard isn't installed, in which case plain .log files are written.
+    """
+
+    def __init__(self, compress: bool = True):
         LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        self.zstd = None
+        if compress:
+            try:
+                import zstandard
+                self.zstd = zstandard
+            except ImportError:
+                pass
 
     def get_log_path(self) -> Path:
         """Generate log file path with date."""
         date_str = datetime.now().strftime("%Y-%m-%d")
-        return LOGS_DIR / f"markets-{date_str}.log"
+        suffix = ".log.zst" if self.zstd else ".log"
+        return LOGS_DIR / f"markets-{date_str}{suffix}"
 
-    def write(self, content: str) -> Path:
-        """Write content to log file."""
+    def write(self, lines: Iterable[str]) -> Path:
+        """Stream lines to the log file, writing a temp file and renaming it into place."""
         log_path = self.get_log_path()
-        with open(log_path, "w") as f:
-            f.write(content)
+        temp_path = log_path.with_name(log_path.name + ".tmp")
+
+        if self.zstd:
+            with open(temp_path, "wb") as f:
+                with self.zstd.ZstdCompressor(level=LOG_ZSTD_LEVEL).stream_writer(f) as writer:
+                    for line in lines:
+                        writer.write((line + "\n").encode())
+        else:
+            with open(temp_path, "w", buffering=1 << 16) as f:
+                f.writelines(line + "\n" for line in lines)
+
+        os.replace(temp_path, log_path)
         return log_path
 
 
-def create_briefing_output(
+def build_briefing(
     crypto_data: list[dict] | None,
     stock_data: dict[str, list[dict]] | None,
-    colored: bool = True,
     show_portfolio: bool = False
-) -> str:
-    """Create the full briefing output."""
+) -> list["BriefingItem"]:
+    """Build the briefing once as raw items, ready to render colored or plain.
+
+    Items are plain strings, Tables, or lists of cells forming a single line.
+    """
     formatter = OutputFormatter()
-    lines = []
+    items = []
 
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     if show_portfolio:
@@ -483,55 +785,80 @@ def create_briefing_output(
         header = f"MARKETS - {timestamp}"
     separator = "=" * 60
 
-    lines.append(separator)
-    lines.append(header.center(60))
-    lines.append(separator)
-    lines.append("")
+    items.append(separator)
+    items.append(header.center(60))
+    items.append(separator)
+    items.append("")
+
+    # Per-section portfolio totals, reused for the table TOTAL rows and the grand total
+    section_totals = []
+
+    def totals_for(data: list[dict]) -> dict | None:
+        if not show_portfolio:
+            return None
+        totals = PortfolioCalculator.calculate_portfolio_totals(data)
+        section_totals.append(totals)
+        return totals
 
     if crypto_data:
-        lines.append("CRYPTOCURRENCIES")
-        lines.append("-" * 60)
-        lines.append(formatter.create_crypto_table(crypto_data, colored, show_portfolio))
-        lines.append("")
+        items.append("CRYPTOCURRENCIES")
+        items.append("-" * 60)
+        items.append(formatter.build_crypto_table(crypto_data, show_portfolio, totals_for(crypto_data)))
+        items.append("")
 
     if stock_data:
-        # Stock category display names
-        category_labels = {
-            "index_funds": "STOCKS - INDEX FUNDS",
-            "etfs": "STOCKS - ETFS",
-            "individual": "STOCKS - INDIVIDUAL"
-        }
-
-        for category in ["index_funds", "etfs", "individual"]:
+        for category in STOCK_CATEGORIES:
             if category in stock_data and stock_data[category]:
-                lines.append(category_labels[category])
-                lines.append("-" * 60)
-                lines.append(formatter.create_stock_table(stock_data[category], colored, show_portfolio))
-                lines.append("")
+                items.append(STOCK_CATEGORY_LABELS[category])
+                items.append("-" * 60)
+                category_data = stock_data[category]
+                items.append(formatter.build_stock_table(category_data, show_portfolio, totals_for(category_data)))
+                items.append("")
 
     # Add grand total if showing portfolio
     if show_portfolio and (crypto_data or stock_data):
-        all_assets = []
-        if crypto_data:
-            all_assets.extend(crypto_data)
-        if stock_data:
-            for category_data in stock_data.values():
-                all_assets.extend(category_data)
-
-        grand_totals = PortfolioCalculator.calculate_portfolio_totals(all_assets)
+        grand_totals = PortfolioCalculator.combine_portfolio_totals(section_totals)
         if grand_totals['num_holdings'] > 0:
-            lines.append("PORTFOLIO SUMMARY")
-            lines.append("-" * 60)
-            lines.append(f"Total Value:      {formatter.format_price(grand_totals['total_value'])}")
-            lines.append(f"Total Cost:       {formatter.format_price(grand_totals['total_cost'])}")
-            lines.append(f"Total Gain/Loss:  {formatter.format_dollars(grand_totals['total_gain_loss_dollars'], colored)}")
-            lines.append(f"Total Return:     {formatter.format_change(grand_totals['total_gain_loss_percent'], colored)}")
-            lines.append(f"Holdings:         {grand_totals['num_holdings']}")
-            lines.append("")
+            items.append("PORTFOLIO SUMMARY")
+            items.append("-" * 60)
+            items.append(["Total Value:      ", ("price", grand_totals['total_value'])])
+            items.append(["Total Cost:       ", ("price", grand_totals['total_cost'])])
+            items.append(["Total Gain/Loss:  ", ("dollars", grand_totals['total_gain_loss_dollars'])])
+            items.append(["Total Return:     ", ("change", grand_totals['total_gain_loss_percent'])])
+            items.append(f"Holdings:         {grand_totals['num_holdings']}")
+            items.append("")
 
-    lines.append(separator)
+    items.append(separator)
+
+    return items
+
+
+def iter_briefing_lines(items: list["BriefingItem"], colored: bool = True) -> Iterator[str]:
+    """Yield rendered lines for briefing items built by build_briefing."""
+    formatter = OutputFormatter()
+
+    for item in items:
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, Table):
+            yield formatter.render_table(item, colored)
+        else:
+            yield "".join(formatter.render_cell(cell, colored) for cell in item)
 
-    return "\n".join(lines)
+
+def render_briefing(items: list["BriefingItem"], colored: bool = True) -> str:
+    """Render briefing items built by build_briefing into a single string."""
+    return "\n".join(iter_briefing_lines(items, colored))
+
+
+def create_briefing_output(
+    crypto_data: list[dict] | None,
+    stock_data: dict[str, list[dict]] | None,
+    colored: bool = True,
+    show_portfolio: bool = False
+) -> str:
+    """Create the full briefing output."""
+    return render_briefing(build_briefing(crypto_data, stock_data, show_portfolio), colored)
 
 
 def parse_args():
@@ -574,14 +901,59 @@ def parse_args():
         action="store_true",
         help="Show only assets with holdings (implies --portfolio)"
     )
+    parser.add_argument(
+        "--plain-log",
+        action="store_true",
+        help="Write an uncompressed .log file instead of .log.zst"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh crypto data (skip the response cache)"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        metavar="SECONDS",
+        help=f"Max age of cached crypto data in seconds (default: {DEFAULT_CACHE_TTL})"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run the crypto and stock fetches on an asyncio event loop"
+    )
     return parser.parse_args()
 
 
-def _fetch_crypto_task(cryptos: list[dict]) -> list[dict] | None:
+# Process-wide fetchers, created on first use so the pooled HTTP client is
+# reused across calls and yfinance imports stay lazy
+_CRYPTO: CryptoFetcher | None = None
+_STOCKS: StockFetcher | None = None
+
+
+def _get_crypto_fetcher(cache: ResponseCache | None = None) -> CryptoFetcher:
+    """Return the shared CryptoFetcher, pointed at the given response cache."""
+    global _CRYPTO
+    if _CRYPTO is None:
+        _CRYPTO = CryptoFetcher()
+    _CRYPTO.cache = cache
+    return _CRYPTO
+
+
+def _get_stock_fetcher() -> StockFetcher:
+    """Return the shared StockFetcher."""
+    global _STOCKS
+    if _STOCKS is None:
+        _STOCKS = StockFetcher()
+    return _STOCKS
+
+
+def _fetch_crypto_task(cryptos: list[dict], cache: ResponseCache | None = None) -> list[dict] | None:
     """Task function for fetching crypto data."""
     try:
-        crypto_fetcher = CryptoFetcher()
-        return crypto_fetcher.fetch_prices(cryptos)
+        return _get_crypto_fetcher(cache).fetch_prices(cryptos)
     except APIError as e:
         print(f"{Fore.RED}Error fetching crypto data: {e}{Style.RESET_ALL}")
         return None
@@ -590,7 +962,7 @@ def _fetch_crypto_task(cryptos: list[dict]) -> list[dict] | None:
 def _fetch_stocks_task(stocks_config: dict | list) -> dict[str, list[dict]] | None:
     """Task function for fetching stock data."""
     try:
-        stock_fetcher = StockFetcher()
+        stock_fetcher = _get_stock_fetcher()
 
         # Handle both old flat array format and new categorized format
         if isinstance(stocks_config, list):
@@ -601,7 +973,7 @@ def _fetch_stocks_task(stocks_config: dict | list) -> dict[str, list[dict]] | No
             all_stocks = []
             ticker_to_category = {}
 
-            for category in ["index_funds", "etfs", "individual"]:
+            for category in STOCK_CATEGORIES:
                 category_stocks = stocks_config.get(category, [])
                 for stock in category_stocks:
                     all_stocks.append(stock)
@@ -614,7 +986,7 @@ def _fetch_stocks_task(stocks_config: dict | list) -> dict[str, list[dict]] | No
             all_results = stock_fetcher.fetch_prices(all_stocks)
 
             # Split results back into categories
-            stock_data = {"index_funds": [], "etfs": [], "individual": []}
+            stock_data = {category: [] for category in STOCK_CATEGORIES}
             for result in all_results:
                 category = ticker_to_category.get(result["ticker"], "individual")
                 stock_data[category].append(result)
@@ -627,6 +999,21 @@ def _fetch_stocks_task(stocks_config: dict | list) -> dict[str, list[dict]] | No
         return None
 
 
+async def _fetch_all_async(
+    cryptos: list[dict],
+    stocks_config: dict | list,
+    cache: ResponseCache | None = None
+) -> tuple[list[dict] | None, dict[str, list[dict]] | None]:
+    """Fetch crypto and stock data concurrently on an event loop.
+
+    Both fetchers are blocking, so each leg is offloaded to a worker thread;
+    additional endpoints can be added to the gather as they're introduced.
+    """
+    crypto_leg = asyncio.to_thread(_fetch_crypto_task, cryptos, cache) if cryptos else asyncio.sleep(0)
+    stocks_leg = asyncio.to_thread(_fetch_stocks_task, stocks_config) if stocks_config else asyncio.sleep(0)
+    return tuple(await asyncio.gather(crypto_leg, stocks_leg))
+
+
 def main():
     """Main entry point."""
     colorama_init()
@@ -639,6 +1026,10 @@ def main():
 
     watchlist = load_watchlist()
 
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(CACHE_DIR / "coingecko", ttl=args.cache_ttl)
+
     # Portfolio-only mode implies portfolio mode
     show_portfolio = args.portfolio or args.portfolio_only
 
@@ -665,7 +1056,7 @@ def main():
     if isinstance(stocks_config, list):
         stock_count = len(stocks_config)
     else:
-        stock_count = sum(len(stocks_config.get(cat, [])) for cat in ["index_funds", "etfs", "individual"])
+        stock_count = sum(len(stocks_config.get(cat, [])) for cat in STOCK_CATEGORIES)
 
     # Print status
     if crypto_count > 0 and stock_count > 0:
@@ -676,9 +1067,15 @@ def main():
         print(f"Fetching stock data for {stock_count} tickers...")
 
     # Fetch crypto and stocks concurrently
-    if crypto_count > 0 and stock_count > 0:
+    if args.use_async and (crypto_count > 0 or stock_count > 0):
+        crypto_data, stock_data = asyncio.run(_fetch_all_async(
+            cryptos if crypto_count > 0 else [],
+            stocks_config if stock_count > 0 else {},
+            cache
+        ))
+    elif crypto_count > 0 and stock_count > 0:
         with ThreadPoolExecutor(max_workers=2) as executor:
-            crypto_future = executor.submit(_fetch_crypto_task, cryptos)
+            crypto_future = executor.submit(_fetch_crypto_task, cryptos, cache)
             stock_future = executor.submit(_fetch_stocks_task, stocks_config)
 
             crypto_data = crypto_future.result()
@@ -686,30 +1083,33 @@ def main():
     else:
         # Only one type to fetch, no need for parallelism
         if crypto_count > 0:
-            crypto_data = _fetch_crypto_task(cryptos)
+            crypto_data = _fetch_crypto_task(cryptos, cache)
         if stock_count > 0:
             stock_data = _fetch_stocks_task(stocks_config)
 
     print()  # Blank line before output
 
-    # Output
+    # Output - build the briefing once, render it colored and/or plain
+    briefing = None
+    if not args.json or not args.no_log:
+        briefing = build_briefing(crypto_data, stock_data, show_portfolio=show_portfolio)
+
     if args.json:
-        output = json.dumps({
+        output = _dumps({
             "timestamp": datetime.now().isoformat(),
             "crypto": crypto_data,
             "stocks": stock_data
-        }, indent=2)
+        })
         print(output)
     else:
         # Terminal output (colored)
-        terminal_output = create_briefing_output(crypto_data, stock_data, colored=True, show_portfolio=show_portfolio)
+        terminal_output = render_briefing(briefing, colored=True)
         print(terminal_output)
 
     # Log file (plain text)
     if not args.no_log:
-        logger = BriefingLogger()
-        plain_output = create_briefing_output(crypto_data, stock_data, colored=False, show_portfolio=show_portfolio)
-        log_path = logger.write(plain_output)
+        logger = BriefingLogger(compress=not args.plain_log)
+        log_path = logger.write(iter_briefing_lines(briefing, colored=False))
         print(f"Log saved to: {log_path}")
 
 
@@ -3,18 +3,36 @@
 TODO List Manager - MCP Server
 
 Provides Claude with tools to manage personal tasks via the todos CLI.
-Uses subprocess calls to the CLI with --json output.
+Runs the CLI in-process with --json output, falling back to subprocess calls.
 """
 
+import importlib.util
+import io
 import json
 import subprocess
 import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+    _loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+
 # CLI path
 CLI_PATH = Path.home() / "claude-agent/automations/tools/todos.sh"
+CLI_MODULE_PATH = CLI_PATH.parent / "todos" / "todos.py"
+_CLI_STR = str(CLI_PATH)
+
+# In-process CLI module: None = not loaded yet, False = unavailable (use subprocess)
+_cli_module = None
+
+# Stream redirection is process-wide, so in-process CLI calls must not overlap
+_cli_lock = threading.Lock()
 
 # Initialize MCP server
 mcp = FastMCP("todos")
@@ -25,30 +43,80 @@ def log(message: str):
     print(f"[todos-mcp] {message}", file=sys.stderr)
 
 
+def _load_cli():
+    """Import the todos CLI module in-process, or return None if it can't be loaded."""
+    global _cli_module
+    if _cli_module is None:
+        try:
+            spec = importlib.util.spec_from_file_location("todos_cli", CLI_MODULE_PATH)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _cli_module = module
+        except Exception as e:
+            log(f"In-process CLI unavailable, using subprocess: {e}")
+            _cli_module = False
+    return _cli_module or None
+
+
 def call_cli(*args) -> dict:
     """Call todos CLI and return parsed JSON output."""
-    cmd = [str(CLI_PATH), "--json", *args]
+    output = io.StringIO()
+    errors = io.StringIO()
+    try:
+        with _cli_lock:
+            # Load under the redirect too: the CLI initializes colorama on import,
+            # which must never wrap the real stdout used by the stdio transport
+            with redirect_stdout(output), redirect_stderr(errors):
+                cli = _load_cli()
+                exit_code = 0
+                if cli is not None:
+                    try:
+                        cli.main(["--json", *args])
+                    except SystemExit as e:
+                        exit_code = e.code or 0
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    if cli is None:
+        return _call_cli_subprocess(*args)
+
+    try:
+        return _loads(output.getvalue())
+    except json.JSONDecodeError as e:
+        if exit_code != 0:
+            return {
+                "success": False,
+                "error": errors.getvalue().strip() or output.getvalue().strip() or "Unknown error"
+            }
+        return {"success": False, "error": f"Invalid JSON from CLI: {e}"}
+
+
+def _call_cli_subprocess(*args) -> dict:
+    """Call todos CLI in a subprocess and return parsed JSON output."""
+    cmd = [_CLI_STR, "--json", *args]
     log(f"Running: {' '.join(cmd)}")
 
     try:
+        # Bytes mode: stdout goes straight to the JSON parser without a text decode
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             timeout=30
         )
 
         if result.returncode != 0:
             # Try to parse JSON error
             try:
-                return json.loads(result.stdout)
+                return _loads(result.stdout)
             except json.JSONDecodeError:
+                error = result.stderr.strip() or result.stdout.strip()
                 return {
                     "success": False,
-                    "error": result.stderr.strip() or result.stdout.strip() or "Unknown error"
+                    "error": error.decode(errors="replace") or "Unknown error"
                 }
 
-        return json.loads(result.stdout)
+        return _loads(result.stdout)
 
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "CLI command timed out"}
@@ -14,18 +14,46 @@ Usage:
 
 import argparse
 import fcntl
+import heapq
 import json
+import mmap
 import os
 import re
+import secrets
 import shutil
 import subprocess
 import sys
-from datetime import datetime, timedelta, timezone
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 from colorama import Fore, Style, init as colorama_init
-from dateutil import parser as date_parser
-from dateutil.relativedelta import relativedelta, MO, TU, WE, TH, FR, SA, SU
+
+# orjson is much faster for the load/save hot paths; stdlib json is the fallback.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_text(obj) -> str:
+        """Compact JSON for --json output."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps_text(obj) -> str:
+        """Compact JSON for --json output."""
+        return json.dumps(obj)
 
 # Initialize colorama for cross-platform color support
 colorama_init()
@@ -46,16 +74,29 @@ MAX_CATEGORY_LENGTH = 30
 VALID_PRIORITIES = ["low", "medium", "high"]
 VALID_STATUSES = ["pending", "completed"]
 
-# Day name mapping for date parsing
-DAY_MAP = {
-    "monday": MO, "mon": MO,
-    "tuesday": TU, "tue": TU, "tues": TU,
-    "wednesday": WE, "wed": WE,
-    "thursday": TH, "thu": TH, "thur": TH, "thurs": TH,
-    "friday": FR, "fri": FR,
-    "saturday": SA, "sat": SA,
-    "sunday": SU, "sun": SU,
-}
+# Files at least this large are parsed straight from an mmap (orjson only);
+# below it, mapping costs more than the read() copy it saves
+MMAP_MIN_BYTES = 64 * 1024
+
+# Also fsync the data directory after renaming a save into place, so the
+# rename itself survives power loss. Turn off on network mounts (SMB/NFS)
+# where directory fsync is slow or unsupported.
+DURABLE = True
+
+# Day name mapping for date parsing (Monday=0, as returned by date.weekday())
+DAY_MAP = MappingProxyType({
+    "monday": 0, "mon": 0,
+    "tuesday": 1, "tue": 1, "tues": 1,
+    "wednesday": 2, "wed": 2,
+    "thursday": 3, "thu": 3, "thur": 3, "thurs": 3,
+    "friday": 4, "fri": 4,
+    "saturday": 5, "sat": 5,
+    "sunday": 6, "sun": 6,
+})
+
+_NEXT_RE = re.compile(r"next\s+(\w+)")
+_IN_RE = re.compile(r"in\s+(\d+)\s+(day|week|month)s?")
+_CATEGORY_RE = re.compile(r"^[a-z0-9-]+$")
 
 
 # =============================================================================
@@ -72,19 +113,176 @@ def ensure_config_dir():
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Parsed JSON files keyed by path: (st_mtime_ns, st_size, data). Lets a
+# long-lived process (the MCP server runs this CLI in-process) skip re-reading
+# and re-parsing files that haven't changed since the last load or save.
+_JSON_CACHE: dict = {}
+
+
+def _copy_json(value):
+    """Copy a JSON-shaped value (cheaper than copy.deepcopy: no memo, no dispatch)."""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def _read_json(path: Path) -> dict:
+    """Parse a JSON file, reusing the cached parse if the file is unchanged.
+
+    Returns a private copy, so callers may mutate it freely.
+    Raises json.JSONDecodeError for corrupt files (which are never cached).
+    """
+    return _copy_json(_read_json_view(path))
+
+
+def _read_json_view(path: Path) -> dict:
+    """Like _read_json, but returns the cached object itself. Do not mutate it."""
+    st = path.stat()
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    if orjson is not None and st.st_size >= MMAP_MIN_BYTES:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                data = _loads(view)
+    else:
+        data = _loads(path.read_bytes())
+    if path == TODOS_FILE or path == ARCHIVE_FILE:
+        _intern_task_fields(data.get("tasks", []))
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _intern_task_fields(tasks: list[dict]) -> None:
+    """Intern the small repeated string fields of freshly parsed tasks.
+
+    Every task then shares one "pending"/"high"/category object, which
+    saves memory on large lists and lets == in the filters short-circuit
+    on identity.
+    """
+    intern = sys.intern
+    for t in tasks:
+        for field in ("status", "priority", "category"):
+            value = t.get(field)
+            if type(value) is str:
+                t[field] = intern(value)
+
+
+def _remember_json(path: Path, data: dict) -> None:
+    """Record data just written to path so the next load skips the parse."""
+    st = path.stat()
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, _copy_json(data))
+
+
+# Lowercased task id -> position in "tasks", per cached todos version:
+# path -> (st_mtime_ns, st_size, index). Built once per version on first lookup.
+_ID_INDEX: dict = {}
+
+
+def _todos_id_index() -> dict | None:
+    """Return the id index for the cached todos file, building it if needed."""
+    cached = _JSON_CACHE.get(TODOS_FILE)
+    if cached is None:
+        return None
+    entry = _ID_INDEX.get(TODOS_FILE)
+    if entry is not None and entry[0] == cached[0] and entry[1] == cached[1]:
+        return entry[2]
+    index = {t["id"].lower(): i for i, t in enumerate(cached[2]["tasks"])}
+    _ID_INDEX[TODOS_FILE] = (cached[0], cached[1], index)
+    return index
+
+
+# Per-field columns of the cached todos, per version: path -> (st_mtime_ns,
+# st_size, {field: [value by task position]}). Filters scan the one column
+# they need instead of looking the field up in every task dict.
+_TASK_COLUMNS: dict = {}
+_COLUMN_FIELDS = ("status", "category", "priority", "due", "completed")
+
+
+def _compare_completed(completed: str, cutoff: datetime, cutoff_key: str) -> int | None:
+    """Compare a completed timestamp to an aware UTC cutoff: -1, 0 or 1.
+
+    cutoff_key is cutoff.isoformat()[:19]. Timestamps written by
+    complete_task are UTC ISO strings, which sort as text, so they are
+    compared to the second without parsing; ties and other offsets fall
+    back to datetime comparison. Returns None if the timestamp is invalid.
+    """
+    stamp = completed.rstrip("Z")
+    if stamp.endswith("+00:00"):
+        key = stamp[:19]
+        if key != cutoff_key:
+            return -1 if key < cutoff_key else 1
+    try:
+        completed_dt = datetime.fromisoformat(stamp)
+    except (ValueError, TypeError):
+        return None
+    # Make timezone-aware if needed
+    if completed_dt.tzinfo is None:
+        completed_dt = completed_dt.replace(tzinfo=timezone.utc)
+    return (completed_dt > cutoff) - (completed_dt < cutoff)
+
+
+def _parse_iso_date(value: str | None) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _build_columns(tasks: list[dict]) -> dict:
+    columns = {field: [t.get(field) for t in tasks] for field in _COLUMN_FIELDS}
+    # Due dates parsed once per file version, so filters compare date objects
+    columns["due_date"] = [_parse_iso_date(d) for d in columns["due"]]
+    return columns
+
+
+def _task_columns(data: dict) -> dict:
+    """Return field columns for data, cached when data is the cached todos view."""
+    cached = _JSON_CACHE.get(TODOS_FILE)
+    if cached is None or cached[2] is not data:
+        return _build_columns(data["tasks"])
+    entry = _TASK_COLUMNS.get(TODOS_FILE)
+    if entry is not None and entry[0] == cached[0] and entry[1] == cached[1]:
+        return entry[2]
+    columns = _build_columns(data["tasks"])
+    _TASK_COLUMNS[TODOS_FILE] = (cached[0], cached[1], columns)
+    return columns
+
+
+def _task_position(data: dict, task_id: str) -> int | None:
+    """Find the position of a task by (lowercased) id in a loaded todos dict."""
+    tasks = data["tasks"]
+    index = _todos_id_index()
+    if index is not None:
+        i = index.get(task_id)
+        # data is normally a copy of the cached version, so the index applies;
+        # the id check guards against callers that reordered tasks in memory
+        if i is not None and i < len(tasks) and tasks[i]["id"].lower() == task_id:
+            return i
+    for i, t in enumerate(tasks):
+        if t["id"].lower() == task_id:
+            return i
+    return None
+
+
 def load_todos() -> dict:
     """Load todos from JSON file. Creates default structure if missing."""
-    ensure_data_dir()
-    if not TODOS_FILE.exists():
-        return {"tasks": [], "categories": ["work", "personal", "errands", "health"]}
+    # No exists() pre-check or mkdir here: the stat in _read_json_view
+    # doubles as the existence test, and saves create the data directory
     try:
-        return json.loads(TODOS_FILE.read_text())
+        return _read_json(TODOS_FILE)
+    except FileNotFoundError:
+        return {"tasks": [], "categories": ["work", "personal", "errands", "health"]}
     except json.JSONDecodeError:
         # Try to restore from backup
         backup = TODOS_FILE.with_suffix(".json.bak")
         if backup.exists():
             try:
-                data = json.loads(backup.read_text())
+                data = _loads(backup.read_bytes())
                 save_todos(data)
                 return data
             except json.JSONDecodeError:
@@ -93,71 +291,134 @@ def load_todos() -> dict:
         return {"tasks": [], "categories": ["work", "personal", "errands", "health"]}
 
 
+def load_todos_view() -> dict:
+    """Load todos for read-only use, without copying the cached parse.
+
+    Read paths (listing, filtering, reminders) only look at task fields, so
+    they skip the per-call copy that load_todos() makes for writers.
+    """
+    try:
+        return _read_json_view(TODOS_FILE)
+    except FileNotFoundError:
+        return {"tasks": [], "categories": ["work", "personal", "errands", "health"]}
+    except json.JSONDecodeError:
+        # Backup restore and defaults live in load_todos
+        return load_todos()
+
+
+def _link_backup(path: Path) -> None:
+    """Point path's .bak at the current file without copying its contents.
+
+    The hard link keeps the old inode alive once the temp file is renamed
+    over path, and path itself never disappears (as it would if renamed
+    to .bak first). Falls back to a copy where hard links are unsupported.
+    """
+    backup = path.with_suffix(".json.bak")
+    backup.unlink(missing_ok=True)
+    try:
+        os.link(path, backup)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.copy(path, backup)
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """Write payload to a temp file, fsync it, and rename it over path."""
+    temp_file = path.with_suffix(".json.tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_file, path)
+    if DURABLE:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
 def save_todos(data: dict) -> None:
     """Save todos to JSON file with file locking and atomic write."""
     ensure_data_dir()
-    LOCK_FILE.touch()
-
-    with open(LOCK_FILE, "w") as lock_file:
+    # Append mode creates the lock file if needed without truncating it
+    with open(LOCK_FILE, "a") as lock_file:
         fcntl.flock(lock_file, fcntl.LOCK_EX)
         try:
             # Backup before write
-            if TODOS_FILE.exists():
-                shutil.copy(TODOS_FILE, TODOS_FILE.with_suffix(".json.bak"))
+            _link_backup(TODOS_FILE)
 
-            # Write atomically
-            temp_file = TODOS_FILE.with_suffix(".json.tmp")
-            temp_file.write_text(json.dumps(data, indent=2))
-            temp_file.rename(TODOS_FILE)
+            _atomic_write(TODOS_FILE, _dumps(data))
+            _remember_json(TODOS_FILE, data)
         finally:
             fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
+@contextmanager
+def todos_transaction():
+    """Load todos once, yield them for several mutations, then save once.
+
+    Pass the yielded dict as data= to complete_task, update_task and
+    delete_task so a batch costs one read and one write. Nothing is saved
+    if the block raises.
+    """
+    data = load_todos()
+    yield data
+    save_todos(data)
+
+
 def load_archive() -> dict:
     """Load archive from JSON file. Creates default structure if missing."""
-    ensure_data_dir()
-    if not ARCHIVE_FILE.exists():
+    try:
+        return _read_json(ARCHIVE_FILE)
+    except (FileNotFoundError, json.JSONDecodeError):
         return {"tasks": []}
+
+
+def load_archive_view() -> dict:
+    """Load the archive for read-only use (see load_todos_view)."""
     try:
-        return json.loads(ARCHIVE_FILE.read_text())
-    except json.JSONDecodeError:
+        return _read_json_view(ARCHIVE_FILE)
+    except (FileNotFoundError, json.JSONDecodeError):
         return {"tasks": []}
 
 
 def save_archive(data: dict) -> None:
     """Save archive to JSON file with file locking and atomic write."""
     ensure_data_dir()
-    ARCHIVE_LOCK_FILE.touch()
-
-    with open(ARCHIVE_LOCK_FILE, "w") as lock_file:
+    # Append mode creates the lock file if needed without truncating it
+    with open(ARCHIVE_LOCK_FILE, "a") as lock_file:
         fcntl.flock(lock_file, fcntl.LOCK_EX)
         try:
             # Backup before write
-            if ARCHIVE_FILE.exists():
-                shutil.copy(ARCHIVE_FILE, ARCHIVE_FILE.with_suffix(".json.bak"))
+            _link_backup(ARCHIVE_FILE)
 
-            # Write atomically
-            temp_file = ARCHIVE_FILE.with_suffix(".json.tmp")
-            temp_file.write_text(json.dumps(data, indent=2))
-            temp_file.rename(ARCHIVE_FILE)
+            _atomic_write(ARCHIVE_FILE, _dumps(data))
+            _remember_json(ARCHIVE_FILE, data)
         finally:
             fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 def load_config() -> dict:
     """Load config from JSON file. Creates default if missing."""
-    ensure_config_dir()
-    if not CONFIG_FILE.exists():
+    try:
+        return _read_json(CONFIG_FILE)
+    except FileNotFoundError:
+        # First run only: write the defaults so the file exists next time
+        ensure_config_dir()
         default_config = {
             "default_priority": "medium",
             "default_category": None,
             "show_completed_days": 7,
             "recipient_phone_number": None
         }
-        CONFIG_FILE.write_text(json.dumps(default_config, indent=2))
+        CONFIG_FILE.write_bytes(_dumps(default_config))
         return default_config
-    try:
-        return json.loads(CONFIG_FILE.read_text())
     except json.JSONDecodeError:
         return {
             "default_priority": "medium",
@@ -171,18 +432,23 @@ def load_config() -> dict:
 # Utilities
 # =============================================================================
 
-def generate_id() -> str:
-    """Generate a unique 4-character hex ID."""
-    import secrets
-    data = load_todos()
-    existing_ids = {task["id"] for task in data["tasks"]}
+def generate_id(existing_ids: set[str] | None = None) -> str:
+    """Generate a unique 4-character hex ID.
 
-    for _ in range(100):  # Avoid infinite loop
-        new_id = secrets.token_hex(2)  # 4 hex chars
+    Pass existing_ids when the caller already has the todos loaded.
+    """
+    if existing_ids is None:
+        data = load_todos_view()
+        existing_ids = {task["id"] for task in data["tasks"]}
+
+    # One random draw, then probe forward to the next free 4-hex-char ID
+    start = secrets.randbelow(0x10000)
+    for offset in range(0x10000):
+        new_id = f"{(start + offset) & 0xFFFF:04x}"
         if new_id not in existing_ids:
             return new_id
 
-    # Fallback: use longer ID
+    # Fallback: every 4-char ID is taken, use longer ID
     return secrets.token_hex(4)
 
 
@@ -190,9 +456,13 @@ def parse_due_date(value: str) -> str | None:
     """Parse natural language date to ISO format (YYYY-MM-DD)."""
     if not value:
         return None
+    return _parse_due(value.lower().strip(), datetime.now().date().isoformat())
 
-    value = value.lower().strip()
-    today = datetime.now().date()
+
+# Keyed on today's date so relative inputs ("tomorrow", "fri") roll over
+@lru_cache(maxsize=1024)
+def _parse_due(value: str, today_iso: str) -> str | None:
+    today = date.fromisoformat(today_iso)
 
     # Handle special keywords
     if value == "today":
@@ -203,23 +473,21 @@ def parse_due_date(value: str) -> str | None:
         return (today - timedelta(days=1)).isoformat()
 
     # Handle "next <day>"
-    next_match = re.match(r"next\s+(\w+)", value)
+    next_match = _NEXT_RE.match(value)
     if next_match:
         day_name = next_match.group(1)
         if day_name in DAY_MAP:
-            next_day = today + relativedelta(weekday=DAY_MAP[day_name](+1))
             # If it's the same day, go to next week
-            if next_day == today:
-                next_day = today + relativedelta(weekday=DAY_MAP[day_name](+2))
-            return next_day.isoformat()
+            delta = (DAY_MAP[day_name] - today.weekday()) % 7 or 7
+            return (today + timedelta(days=delta)).isoformat()
 
     # Handle day names (this or next occurrence)
     if value in DAY_MAP:
-        next_day = today + relativedelta(weekday=DAY_MAP[value](+1))
-        return next_day.isoformat()
+        delta = (DAY_MAP[value] - today.weekday()) % 7
+        return (today + timedelta(days=delta)).isoformat()
 
     # Handle relative days
-    in_match = re.match(r"in\s+(\d+)\s+(day|week|month)s?", value)
+    in_match = _IN_RE.match(value)
     if in_match:
         num = int(in_match.group(1))
         unit = in_match.group(2)
@@ -228,9 +496,16 @@ def parse_due_date(value: str) -> str | None:
         elif unit == "week":
             return (today + timedelta(weeks=num)).isoformat()
         elif unit == "month":
+            from dateutil.relativedelta import relativedelta
             return (today + relativedelta(months=num)).isoformat()
 
-    # Try to parse as date
+    # ISO dates are the common explicit form; dateutil handles everything else
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        pass
+
+    from dateutil import parser as date_parser
     try:
         parsed = date_parser.parse(value, dayfirst=False)
         return parsed.date().isoformat()
@@ -238,24 +513,47 @@ def parse_due_date(value: str) -> str | None:
         return None
 
 
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=1024)
+def _short_date(iso: str) -> str | None:
+    """Format the date part of an ISO date/timestamp as 'Dec 25', or None if invalid."""
+    try:
+        d = date.fromisoformat(iso[:10])
+    except ValueError:
+        return None
+    return f"{_MONTH_ABBR[d.month]} {d.day}"
+
+
 def format_date(iso_date: str) -> str:
     """Format ISO date for display (e.g., 'Dec 25')."""
     if not iso_date:
         return ""
-    try:
-        d = datetime.fromisoformat(iso_date).date()
-        return d.strftime("%b %d").replace(" 0", " ")
-    except ValueError:
-        return iso_date
+    return _short_date(iso_date) or iso_date
+
 
+def is_overdue(iso_date: str | None, today_iso: str | None = None) -> bool:
+    """Check if a date is before today.
 
-def is_overdue(iso_date: str | None) -> bool:
-    """Check if a date is before today."""
+    Loops over many tasks can pass today_iso to read the clock once.
+    """
     if not iso_date:
         return False
+    if today_iso is None:
+        today_iso = datetime.now().date().isoformat()
+    # Stored due dates are YYYY-MM-DD, which order the same as text
+    if len(iso_date) == 10:
+        return iso_date < today_iso
+    return _is_overdue(iso_date, today_iso)
+
+
+@lru_cache(maxsize=1024)
+def _is_overdue(iso_date: str, today_iso: str) -> bool:
     try:
         due = datetime.fromisoformat(iso_date).date()
-        return due < datetime.now().date()
+        return due < date.fromisoformat(today_iso)
     except ValueError:
         return False
 
@@ -320,7 +618,7 @@ def validate_category(category: str) -> str | None:
     """Validate category name. Returns error message or None if valid."""
     if not category:
         return None
-    if not re.match(r"^[a-z0-9-]+$", category):
+    if not _CATEGORY_RE.match(category):
         return "Invalid category: use lowercase letters, numbers, and hyphens only"
     if len(category) > MAX_CATEGORY_LENGTH:
         return f"Category name exceeds {MAX_CATEGORY_LENGTH} characters"
@@ -364,9 +662,11 @@ def add_task(text: str, category: str = None, priority: str = None, due: str = N
             return {"success": False, "error": f"Invalid due date: {due}"}
         due = parsed_due
 
+    data = load_todos()
+
     # Create task
     task = {
-        "id": generate_id(),
+        "id": generate_id({t["id"] for t in data["tasks"]}),
         "text": text,
         "category": category,
         "priority": priority,
@@ -376,9 +676,6 @@ def add_task(text: str, category: str = None, priority: str = None, due: str = N
         "completed": None
     }
 
-    # Save
-    data = load_todos()
-
     # Auto-add category if not exists
     if category and category not in data["categories"]:
         data["categories"].append(category)
@@ -391,90 +688,102 @@ def add_task(text: str, category: str = None, priority: str = None, due: str = N
 
 def get_archived_tasks(category: str = None, limit: int = None) -> list[dict]:
     """Get archived tasks with optional filters."""
-    archive = load_archive()
+    archive = load_archive_view()
     tasks = archive.get("tasks", [])
 
-    # Filter by category
+    # Filter by category, lazily so the sort below is the only pass
     if category:
         category = category.lower()
-        tasks = [t for t in tasks if t.get("category") == category]
-
-    # Sort by archived_at (most recent first)
-    tasks.sort(key=lambda t: t.get("archived_at", ""), reverse=True)
+        tasks = (t for t in tasks if t.get("category") == category)
 
-    # Limit results
+    # Sort by archived_at (most recent first), keeping only the first `limit`;
+    # neither sorts the cached list in place
     if limit:
-        tasks = tasks[:limit]
+        return heapq.nlargest(limit, tasks, key=_archived_at)
+    return sorted(tasks, key=_archived_at, reverse=True)
+
 
-    return tasks
+def _archived_at(task: dict) -> str:
+    return task.get("archived_at", "")
 
 
 def get_tasks(status: str = None, category: str = None, priority: str = None,
               due_filter: str = None, include_all: bool = False) -> list[dict]:
     """Get tasks with optional filters."""
-    data = load_todos()
+    data = load_todos_view()
     config = load_config()
-    tasks = data["tasks"]
+    columns = _task_columns(data)
+    statuses = columns["status"]
+
+    # Filters narrow a list of task positions; tasks are materialized at the
+    # end, into a new list so callers can't reorder the cached one
+    selected = range(len(statuses))
 
     # Filter by status
     if status == "pending":
-        tasks = [t for t in tasks if t["status"] == "pending"]
+        selected = [i for i in selected if statuses[i] == "pending"]
     elif status == "completed":
-        tasks = [t for t in tasks if t["status"] == "completed"]
+        selected = [i for i in selected if statuses[i] == "completed"]
     elif not include_all:
         # By default, show pending + recently completed
         show_days = config.get("show_completed_days", 7)
         cutoff = datetime.now(timezone.utc) - timedelta(days=show_days)
-        tasks = [
-            t for t in tasks
-            if t["status"] == "pending" or (
-                t["status"] == "completed" and
-                t.get("completed") and
-                datetime.fromisoformat(t["completed"].rstrip("Z")) > cutoff
+        cutoff_key = cutoff.isoformat()[:19]
+        completed = columns["completed"]
+        selected = [
+            i for i in selected
+            if statuses[i] == "pending" or (
+                statuses[i] == "completed" and
+                completed[i] and
+                _compare_completed(completed[i], cutoff, cutoff_key) == 1
             )
         ]
 
     # Filter by category
     if category:
         category = category.lower()
-        tasks = [t for t in tasks if t.get("category") == category]
+        categories = columns["category"]
+        selected = [i for i in selected if categories[i] == category]
 
     # Filter by priority
     if priority:
         priority = priority.lower()
-        tasks = [t for t in tasks if t.get("priority") == priority]
+        priorities = columns["priority"]
+        selected = [i for i in selected if priorities[i] == priority]
 
     # Filter by due date
     if due_filter:
+        due_dates = columns["due_date"]
         today = datetime.now().date()
         if due_filter == "today":
-            tasks = [t for t in tasks if t.get("due") and (
-                datetime.fromisoformat(t["due"]).date() <= today
-            )]
+            selected = [i for i in selected if due_dates[i] and due_dates[i] <= today]
         elif due_filter == "week":
             week_end = today + timedelta(days=7)
-            tasks = [t for t in tasks if t.get("due") and (
-                datetime.fromisoformat(t["due"]).date() <= week_end
-            )]
+            selected = [i for i in selected if due_dates[i] and due_dates[i] <= week_end]
         elif due_filter == "overdue":
-            tasks = [t for t in tasks if is_overdue(t.get("due"))]
+            selected = [i for i in selected if due_dates[i] and due_dates[i] < today]
 
-    return tasks
+    tasks = data["tasks"]
+    return [tasks[i] for i in selected]
 
 
-def find_task(id_or_text: str) -> dict | list[dict]:
-    """Find task by ID or text. Returns task, list of matches, or None."""
-    data = load_todos()
+def find_task(id_or_text: str, data: dict | None = None) -> dict | list[dict]:
+    """Find task by ID or text. Returns task, list of matches, or None.
+
+    Searches data when given (e.g. inside todos_transaction), else the file.
+    """
+    if data is None:
+        data = load_todos_view()
     id_or_text = id_or_text.lower().strip()
 
     # Try exact ID match first
-    for task in data["tasks"]:
-        if task["id"].lower() == id_or_text:
-            return task
+    i = _task_position(data, id_or_text)
+    if i is not None:
+        return data["tasks"][i]
 
     # Try text match (only pending tasks)
-    pending = [t for t in data["tasks"] if t["status"] == "pending"]
-    matches = [t for t in pending if id_or_text in t["text"].lower()]
+    matches = [t for t in data["tasks"]
+               if t["status"] == "pending" and id_or_text in t["text"].lower()]
 
     if len(matches) == 1:
         return matches[0]
@@ -484,9 +793,12 @@ def find_task(id_or_text: str) -> dict | list[dict]:
     return None
 
 
-def complete_task(id_or_text: str) -> dict:
-    """Mark a task as completed. Returns result dict."""
-    result = find_task(id_or_text)
+def complete_task(id_or_text: str, data: dict | None = None) -> dict:
+    """Mark a task as completed. Returns result dict.
+
+    With data (from todos_transaction), mutates it and leaves saving to the caller.
+    """
+    result = find_task(id_or_text, data)
 
     if result is None:
         return {"success": False, "error": f"Task not found: {id_or_text}"}
@@ -502,40 +814,48 @@ def complete_task(id_or_text: str) -> dict:
     if task["status"] == "completed":
         return {"success": False, "error": f"Task already completed: {task['text']}"}
 
-    # Update task
-    data = load_todos()
-    for t in data["tasks"]:
-        if t["id"] == task["id"]:
-            t["status"] = "completed"
-            t["completed"] = datetime.now(timezone.utc).isoformat() + "Z"
-            task = t
-            break
-
-    save_todos(data)
+    # Update task. Without data, find_task returned an object from the shared
+    # cached view, which must never be mutated: re-fetch it from a fresh copy
+    owned = data is None
+    if owned:
+        data = load_todos()
+        i = _task_position(data, task["id"].lower())
+        if i is None:
+            # The file changed between the two reads
+            return {"success": False, "error": f"Task not found: {id_or_text}"}
+        task = data["tasks"][i]
+    task["status"] = "completed"
+    task["completed"] = datetime.now(timezone.utc).isoformat() + "Z"
+
+    if owned:
+        save_todos(data)
     return {"success": True, "task": task}
 
 
-def update_task(task_id: str, **updates) -> dict:
-    """Update task fields. Returns result dict."""
-    data = load_todos()
+def update_task(task_id: str, data: dict | None = None, **updates) -> dict:
+    """Update task fields. Returns result dict.
+
+    With data (from todos_transaction), mutates it and leaves saving to the caller.
+    """
+    owned = data is None
+    if owned:
+        data = load_todos()
     task_id = task_id.lower().strip()
 
     # Find task
-    task = None
-    for t in data["tasks"]:
-        if t["id"].lower() == task_id:
-            task = t
-            break
-
-    if task is None:
+    i = _task_position(data, task_id)
+    if i is None:
         return {"success": False, "error": f"Task not found: {task_id}"}
+    task = data["tasks"][i]
 
-    # Validate and apply updates
+    # Validate everything before touching the task, so a rejected update
+    # leaves a shared transaction's data unchanged
+    changes = {}
     if "text" in updates and updates["text"]:
         text = updates["text"].strip()
         if err := validate_text(text):
             return {"success": False, "error": err}
-        task["text"] = text
+        changes["text"] = text
 
     if "category" in updates:
         category = updates["category"]
@@ -543,16 +863,13 @@ def update_task(task_id: str, **updates) -> dict:
             category = category.lower().strip()
             if err := validate_category(category):
                 return {"success": False, "error": err}
-            # Auto-add category
-            if category not in data["categories"]:
-                data["categories"].append(category)
-        task["category"] = category
+        changes["category"] = category
 
     if "priority" in updates and updates["priority"]:
         priority = updates["priority"].lower()
         if err := validate_priority(priority):
             return {"success": False, "error": err}
-        task["priority"] = priority
+        changes["priority"] = priority
 
     if "due" in updates:
         due = updates["due"]
@@ -560,27 +877,40 @@ def update_task(task_id: str, **updates) -> dict:
             parsed = parse_due_date(due)
             if parsed is None:
                 return {"success": False, "error": f"Invalid due date: {due}"}
-            task["due"] = parsed
+            changes["due"] = parsed
         else:
-            task["due"] = None
+            changes["due"] = None
 
-    save_todos(data)
+    # Auto-add category
+    category = changes.get("category")
+    if category and category not in data["categories"]:
+        data["categories"].append(category)
+    task.update(changes)
+
+    if owned:
+        save_todos(data)
     return {"success": True, "task": task}
 
 
-def delete_task(task_id: str) -> dict:
-    """Delete a task. Returns result dict."""
-    data = load_todos()
+def delete_task(task_id: str, data: dict | None = None) -> dict:
+    """Delete a task. Returns result dict.
+
+    With data (from todos_transaction), mutates it and leaves saving to the caller.
+    """
+    owned = data is None
+    if owned:
+        data = load_todos()
     task_id = task_id.lower().strip()
 
     # Find and remove task
-    for i, task in enumerate(data["tasks"]):
-        if task["id"].lower() == task_id:
-            deleted = data["tasks"].pop(i)
-            save_todos(data)
-            return {"success": True, "task": deleted}
+    i = _task_position(data, task_id)
+    if i is None:
+        return {"success": False, "error": f"Task not found: {task_id}"}
 
-    return {"success": False, "error": f"Task not found: {task_id}"}
+    deleted = data["tasks"].pop(i)
+    if owned:
+        save_todos(data)
+    return {"success": True, "task": deleted}
 
 
 # =============================================================================
@@ -589,8 +919,8 @@ def delete_task(task_id: str) -> dict:
 
 def get_categories() -> list[str]:
     """Get list of categories."""
-    data = load_todos()
-    return data.get("categories", [])
+    data = load_todos_view()
+    return list(data.get("categories", []))
 
 
 def add_category(name: str) -> dict:
@@ -656,40 +986,25 @@ def archive_tasks(before_date: str = None, archive_all: bool = False) -> dict:
         parsed = parse_due_date(before_date)
         if parsed is None:
             return {"success": False, "error": f"Invalid date: {before_date}"}
-        cutoff = datetime.fromisoformat(parsed)
+        # Naive dates are treated as UTC
+        cutoff = datetime.fromisoformat(parsed).replace(tzinfo=timezone.utc)
     else:
         # Default: 30 days ago
         cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    cutoff_key = cutoff.isoformat()[:19] if cutoff else None
 
     # Find tasks to archive
     to_archive = []
     remaining = []
+    archived_at = datetime.now(timezone.utc).isoformat() + "Z"
 
     for task in data["tasks"]:
-        if task["status"] != "completed":
-            remaining.append(task)
-            continue
-
-        # Check if task should be archived
-        should_archive = False
-        if archive_all:
-            should_archive = True
-        elif task.get("completed"):
-            try:
-                completed_dt = datetime.fromisoformat(task["completed"].rstrip("Z"))
-                # Make timezone-aware if needed
-                if completed_dt.tzinfo is None:
-                    completed_dt = completed_dt.replace(tzinfo=timezone.utc)
-                if cutoff.tzinfo is None:
-                    cutoff = cutoff.replace(tzinfo=timezone.utc)
-                should_archive = completed_dt < cutoff
-            except (ValueError, TypeError):
-                # If we can't parse the date, don't archive
-                pass
-
-        if should_archive:
-            # Add archived_at timestamp
-            task["archived_at"] = datetime.now(timezone.utc).isoformat() + "Z"
+        if task["status"] == "completed" and (archive_all or (
+            # If we can't parse the date (None), don't archive
+            task.get("completed") and
+            _compare_completed(task["completed"], cutoff, cutoff_key) == -1
+        )):
+            task["archived_at"] = archived_at
             to_archive.append(task)
         else:
             remaining.append(task)
@@ -714,22 +1029,22 @@ def archive_tasks(before_date: str = None, archive_all: bool = False) -> dict:
 def cmd_remind(overdue_only: bool = False, dry_run: bool = False,
                use_json: bool = False, imessage: bool = False) -> dict:
     """Check for overdue/due-soon tasks and send notifications."""
-    data = load_todos()
+    data = load_todos_view()
     config = load_config()
-    tasks = [t for t in data["tasks"] if t["status"] == "pending"]
+    columns = _task_columns(data)
+    tasks = data["tasks"]
     today = datetime.now().date()
 
     overdue = []
     due_today = []
 
-    for task in tasks:
-        if not task.get("due"):
+    for i, (status, due_date) in enumerate(zip(columns["status"], columns["due_date"])):
+        if status != "pending" or due_date is None:
             continue
-        due_date = datetime.fromisoformat(task["due"]).date()
         if due_date < today:
-            overdue.append(task)
+            overdue.append(tasks[i])
         elif due_date == today and not overdue_only:
-            due_today.append(task)
+            due_today.append(tasks[i])
 
     notifications_sent = 0
 
@@ -739,14 +1054,14 @@ def cmd_remind(overdue_only: bool = False, dry_run: bool = False,
         if not recipient:
             error_msg = "recipient_phone_number not configured in .config/todos-config.json"
             if use_json:
-                print(json.dumps({"success": False, "error": error_msg}))
+                print(_dumps_text({"success": False, "error": error_msg}))
             else:
                 print_error(error_msg)
             return {"success": False, "error": error_msg}
 
         if not overdue and not due_today:
             if use_json:
-                print(json.dumps({"success": True, "overdue_count": 0,
+                print(_dumps_text({"success": True, "overdue_count": 0,
                                   "due_today_count": 0, "notifications_sent": 0}))
             else:
                 print(f"{Fore.GREEN}No tasks due.{Style.RESET_ALL}")
@@ -790,37 +1105,35 @@ def cmd_remind(overdue_only: bool = False, dry_run: bool = False,
             "imessage": True
         }
         if use_json:
-            print(json.dumps(result))
+            print(_dumps_text(result))
         return result
 
-    # macOS notification mode (default)
-    if overdue:
+    # macOS notification mode (default): one notification covering both lists
+    notification = None
+    if overdue and due_today:
+        notification = ("Task Reminders",
+                        f"{len(overdue)} overdue, {len(due_today)} due today")
+    elif overdue:
         count = len(overdue)
-        title = "Overdue Tasks"
         if count == 1:
             message = overdue[0]["text"][:50]
         else:
             message = f"{count} tasks overdue"
-
-        if dry_run:
-            print(f"Would notify: {title} - {message}")
-        else:
-            if send_notification(title, message):
-                notifications_sent += 1
-
-    if due_today:
+        notification = ("Overdue Tasks", message)
+    elif due_today:
         count = len(due_today)
-        title = "Due Today"
         if count == 1:
             message = due_today[0]["text"][:50]
         else:
             message = f"{count} tasks due today"
+        notification = ("Due Today", message)
 
+    if notification:
+        title, message = notification
         if dry_run:
             print(f"Would notify: {title} - {message}")
-        else:
-            if send_notification(title, message):
-                notifications_sent += 1
+        elif send_notification(title, message):
+            notifications_sent = 1
 
     result = {
         "success": True,
@@ -831,7 +1144,7 @@ def cmd_remind(overdue_only: bool = False, dry_run: bool = False,
     }
 
     if use_json:
-        print(json.dumps(result))
+        print(_dumps_text(result))
     elif not dry_run:
         total = len(overdue) + len(due_today)
         if total == 0:
@@ -850,10 +1163,18 @@ def cmd_remind(overdue_only: bool = False, dry_run: bool = False,
 # Output Formatting
 # =============================================================================
 
+def _task_response(task: dict) -> str:
+    """JSON for a successful single-task confirmation.
+
+    The envelope is fixed, so only the task itself goes through the encoder.
+    """
+    return f'{{"success":true,"task":{_dumps_text(task)}}}'
+
+
 def print_error(message: str, use_json: bool = False):
     """Print error message."""
     if use_json:
-        print(json.dumps({"success": False, "error": message}))
+        print(_dumps_text({"success": False, "error": message}))
     else:
         print(f"{Fore.RED}Error: {message}{Style.RESET_ALL}", file=sys.stderr)
 
@@ -861,12 +1182,13 @@ def print_error(message: str, use_json: bool = False):
 def print_success(message: str, use_json: bool = False, data: dict = None):
     """Print success message."""
     if use_json:
-        print(json.dumps({"success": True, **(data or {})}))
+        print(_dumps_text({"success": True, **(data or {})}))
     else:
         print(f"{Fore.GREEN}{message}{Style.RESET_ALL}")
 
 
-def format_task_line(task: dict, show_status: bool = False) -> str:
+def format_task_line(task: dict, show_status: bool = False,
+                     today_iso: str | None = None) -> str:
     """Format a single task for display."""
     parts = []
 
@@ -892,7 +1214,7 @@ def format_task_line(task: dict, show_status: bool = False) -> str:
     # Due date
     if task.get("due"):
         due_str = format_date(task["due"])
-        if is_overdue(task["due"]) and task["status"] == "pending":
+        if is_overdue(task["due"], today_iso) and task["status"] == "pending":
             parts.append(f"{Fore.RED}OVERDUE {due_str}{Style.RESET_ALL}")
         else:
             parts.append(f"{Fore.BLUE}{due_str}{Style.RESET_ALL}")
@@ -902,31 +1224,44 @@ def format_task_line(task: dict, show_status: bool = False) -> str:
 
 def print_task_list(tasks: list[dict], show_all: bool = False, use_json: bool = False):
     """Print formatted task list."""
+    today_iso = datetime.now().date().isoformat()
+
+    # Single pass: pending tasks bucketed by priority, plus completed
+    by_priority = {"high": [], "medium": [], "low": []}
+    completed = []
+    pending_count = 0
+    overdue_count = 0
+    for t in tasks:
+        status = t["status"]
+        if status == "pending":
+            pending_count += 1
+            if is_overdue(t.get("due"), today_iso):
+                overdue_count += 1
+            bucket = by_priority.get(t.get("priority"))
+            if bucket is not None:
+                bucket.append(t)
+        elif status == "completed":
+            completed.append(t)
+
     if use_json:
-        pending = [t for t in tasks if t["status"] == "pending"]
-        overdue = [t for t in pending if is_overdue(t.get("due"))]
-        print(json.dumps({
+        print(_dumps_text({
             "success": True,
             "tasks": tasks,
             "count": len(tasks),
-            "pending_count": len(pending),
-            "overdue_count": len(overdue)
+            "pending_count": pending_count,
+            "overdue_count": overdue_count
         }))
         return
 
-    pending = [t for t in tasks if t["status"] == "pending"]
-    completed = [t for t in tasks if t["status"] == "completed"]
-
     if not tasks:
         print(f"\n{Fore.YELLOW}No tasks found.{Style.RESET_ALL}\n")
         return
 
     # Group pending by priority
-    print(f"\nTODOs ({len(pending)} pending)")
+    print(f"\nTODOs ({pending_count} pending)")
     print("-" * 60)
 
-    for priority in ["high", "medium", "low"]:
-        priority_tasks = [t for t in pending if t.get("priority") == priority]
+    for priority, priority_tasks in by_priority.items():
         if priority_tasks:
             color = {
                 "high": Fore.RED,
@@ -935,13 +1270,13 @@ def print_task_list(tasks: list[dict], show_all: bool = False, use_json: bool =
             }[priority]
             print(f"\n  {color}{priority.upper()}{Style.RESET_ALL}")
             for task in priority_tasks:
-                print(format_task_line(task))
+                print(format_task_line(task, today_iso=today_iso))
 
     # Show completed if requested
     if show_all and completed:
         print(f"\n  {Fore.GREEN}COMPLETED{Style.RESET_ALL}")
         for task in completed[:10]:  # Limit to recent 10
-            print(format_task_line(task, show_status=True))
+            print(format_task_line(task, show_status=True, today_iso=today_iso))
         if len(completed) > 10:
             print(f"  ... and {len(completed) - 10} more completed tasks")
 
@@ -951,7 +1286,7 @@ def print_task_list(tasks: list[dict], show_all: bool = False, use_json: bool =
 def print_task_added(task: dict, use_json: bool = False):
     """Print task added confirmation."""
     if use_json:
-        print(json.dumps({"success": True, "task": task}))
+        print(_task_response(task))
         return
 
     print(f"\n{Fore.GREEN}Added:{Style.RESET_ALL} \"{task['text']}\" [{task['id']}]")
@@ -967,7 +1302,7 @@ def print_task_added(task: dict, use_json: bool = False):
 def print_task_completed(task: dict, use_json: bool = False):
     """Print task completed confirmation."""
     if use_json:
-        print(json.dumps({"success": True, "task": task}))
+        print(_task_response(task))
         return
 
     print(f"\n{Fore.GREEN}Completed:{Style.RESET_ALL} \"{task['text']}\" [{task['id']}]\n")
@@ -976,7 +1311,7 @@ def print_task_completed(task: dict, use_json: bool = False):
 def print_task_deleted(task: dict, use_json: bool = False):
     """Print task deleted confirmation."""
     if use_json:
-        print(json.dumps({"success": True, "task": task}))
+        print(_task_response(task))
         return
 
     print(f"\n{Fore.YELLOW}Deleted:{Style.RESET_ALL} \"{task['text']}\" [{task['id']}]\n")
@@ -985,7 +1320,7 @@ def print_task_deleted(task: dict, use_json: bool = False):
 def print_disambiguation(matches: list[dict], search_term: str, use_json: bool = False):
     """Print disambiguation message for multiple matches."""
     if use_json:
-        print(json.dumps({
+        print(_dumps_text({
             "success": False,
             "error": "Multiple tasks match",
             "matches": matches
@@ -1001,7 +1336,7 @@ def print_disambiguation(matches: list[dict], search_term: str, use_json: bool =
 def print_categories(categories: list[str], use_json: bool = False):
     """Print category list."""
     if use_json:
-        print(json.dumps({"success": True, "categories": categories}))
+        print(_dumps_text({"success": True, "categories": categories}))
         return
 
     print(f"\n{Fore.CYAN}Categories:{Style.RESET_ALL}")
@@ -1013,10 +1348,10 @@ def print_categories(categories: list[str], use_json: bool = False):
 def print_archived_list(tasks: list[dict], use_json: bool = False):
     """Print formatted archived task list."""
     if use_json:
-        print(json.dumps({
+        print(_dumps_text({
             "success": True,
-            "tasks": tasks,
-            "count": len(tasks)
+            "count": len(tasks),
+            "tasks": tasks
         }))
         return
 
@@ -1041,12 +1376,9 @@ def print_archived_list(tasks: list[dict], use_json: bool = False):
             parts.append(f"{Fore.YELLOW}{task['category']:<12}{Style.RESET_ALL}")
 
         if task.get("archived_at"):
-            try:
-                archived_dt = datetime.fromisoformat(task["archived_at"].rstrip("Z"))
-                archived_str = archived_dt.strftime("%b %d").replace(" 0", " ")
+            archived_str = _short_date(task["archived_at"])
+            if archived_str:
                 parts.append(f"{Fore.WHITE}archived {archived_str}{Style.RESET_ALL}")
-            except ValueError:
-                pass
 
         print("  " + " ".join(parts))
 
@@ -1057,7 +1389,7 @@ def print_archived_list(tasks: list[dict], use_json: bool = False):
 # CLI
 # =============================================================================
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Personal TODO list manager",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -1127,7 +1459,7 @@ def main():
     archived_parser.add_argument("--limit", "-n", type=int, default=20,
                                  help="Max number of tasks to show (default: 20)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     use_json = args.json
 
     # Disable colors if requested
@@ -1195,7 +1527,7 @@ def main():
             result = update_task(args.task_id, **updates)
             if result["success"]:
                 if use_json:
-                    print(json.dumps({"success": True, "task": result["task"]}))
+                    print(_task_response(result["task"]))
                 else:
                     print(f"\n{Fore.GREEN}Updated:{Style.RESET_ALL} \"{result['task']['text']}\" [{result['task']['id']}]\n")
             else:
@@ -1203,14 +1535,13 @@ def main():
                 sys.exit(1)
 
         elif args.command in ["remove", "rm"]:
+            # One load serves both the confirmation prompt and the delete
+            data = load_todos()
+
             # Confirm deletion unless --force
             if not args.force and not use_json:
-                data = load_todos()
-                task = None
-                for t in data["tasks"]:
-                    if t["id"].lower() == args.task_id.lower():
-                        task = t
-                        break
+                i = _task_position(data, args.task_id.lower().strip())
+                task = data["tasks"][i] if i is not None else None
 
                 if task:
                     response = input(f"Delete \"{task['text']}\" [{task['id']}]? (y/N): ")
@@ -1218,8 +1549,9 @@ def main():
                         print("Cancelled.")
                         sys.exit(0)
 
-            result = delete_task(args.task_id)
+            result = delete_task(args.task_id, data=data)
             if result["success"]:
+                save_todos(data)
                 print_task_deleted(result["task"], use_json=use_json)
             else:
                 print_error(result["error"], use_json=use_json)
@@ -1230,7 +1562,7 @@ def main():
                 result = add_category(args.name)
                 if result["success"]:
                     if use_json:
-                        print(json.dumps(result))
+                        print(_dumps_text(result))
                     else:
                         print(f"\n{Fore.GREEN}Added category:{Style.RESET_ALL} {args.name}\n")
                 else:
@@ -1241,7 +1573,7 @@ def main():
                 result = remove_category(args.name)
                 if result["success"]:
                     if use_json:
-                        print(json.dumps(result))
+                        print(_dumps_text(result))
                     else:
                         print(f"\n{Fore.YELLOW}Removed category:{Style.RESET_ALL} {args.name}\n")
                 else:
@@ -1268,7 +1600,7 @@ def main():
             )
             if result["success"]:
                 if use_json:
-                    print(json.dumps(result))
+                    print(_dumps_text(result))
                 else:
                     count = result["archived_count"]
                     if count == 0:
@@ -9,6 +9,7 @@ Synthesizes multiple data sources into a unified portfolio view:
 
 import time
 from datetime import datetime
+from operator import itemgetter
 from threading import Lock
 from typing import Optional
 
@@ -258,7 +259,7 @@ def build_asset_list(
             })
 
     # Sort by value descending
-    assets.sort(key=lambda x: x.get("value", 0), reverse=True)
+    assets.sort(key=itemgetter("value"), reverse=True)
 
     return assets
 
@@ -4,15 +4,15 @@ CLI command handlers for the finance CLI.
 Each cmd_* function handles a specific subcommand.
 """
 
-import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 from colorama import Fore, Style
-from tabulate import tabulate
 
 from config import (
     REPO_ROOT,
@@ -22,7 +22,18 @@ from config import (
     DEFAULT_PROFILE,
     USE_DATABASE,
 )
-from formatting import format_header, format_success, format_error
+from formatting import (
+    format_header,
+    format_success,
+    format_error,
+    GREEN,
+    YELLOW,
+    WHITE,
+    DIM,
+    BRIGHT,
+    RESET,
+)
+from jsonio import dumps, print_json
 from profile import (
     load_profile,
     save_profile,
@@ -43,6 +54,7 @@ from advisor import get_advice
 from snapshots import (
     save_snapshot,
     load_snapshots,
+    iter_snapshot_summaries,
     get_latest_snapshot,
     get_latest_by_account_type,
 )
@@ -58,9 +70,18 @@ from templates import (
     prompt_for_missing_assets,
 )
 
-# Import parser from parsers module
+# Parser and tabulate are imported inside the commands that use them, so
+# commands like `history --json` don't pay for pdfplumber/pdfminer at startup
 sys.path.insert(0, str(Path(__file__).parent))
-from parsers.sofi_apex import parse_statement, is_sofi_apex_statement
+
+# Money cells in a rendered table, e.g. "$1,234.50"
+_MONEY_CELL_RE = re.compile(r"(\$-?[\d,]+\.\d{2})")
+
+# A rendered holdings row: symbol, name, qty and price, value, pct
+_HOLDING_ROW_RE = re.compile(
+    r"^(\S+)(\s+)(.*?)(\s+-?[\d,.]+\s+\$-?[\d,]+\.\d{2}\s+)(\$-?[\d,]+\.\d{2})(\s+-?[\d.]+%)$",
+    re.MULTILINE
+)
 
 
 def cmd_plan(args):
@@ -68,7 +89,7 @@ def cmd_plan(args):
     if not TEMPLATE_PATH.exists():
         result = {"success": False, "error": f"Template not found: {TEMPLATE_PATH}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -80,7 +101,7 @@ def cmd_plan(args):
     if not latest_by_type:
         result = {"success": False, "error": "No snapshots found. Run 'finance pull' first."}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -121,7 +142,7 @@ def cmd_plan(args):
             "accounts_included": accounts_included,
             "as_of_dates": as_of_dates
         }
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
     else:
         output_path = REPO_ROOT / "finance" / "templates" / "PLANNING_SESSION.md"
         should_save = not getattr(args, 'no_save', False)
@@ -155,7 +176,7 @@ def cmd_profile(args):
     profile = load_profile()
 
     if args.json:
-        print(json.dumps(profile, indent=2))
+        print_json(profile, indent=True)
         return 0
 
     if getattr(args, 'reset', False):
@@ -252,7 +273,7 @@ def cmd_holdings(args):
         )
 
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             if result["success"]:
                 holding = result["holding"]
@@ -269,7 +290,7 @@ def cmd_holdings(args):
         result = check_holdings_freshness()
 
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             if result["is_stale"]:
                 print(f"{Fore.YELLOW}Warning:{Style.RESET_ALL} {result['message']}")
@@ -289,7 +310,7 @@ def cmd_holdings(args):
 
     if args.json:
         output = build_holdings_json(holdings, crypto_prices)
-        print(json.dumps(output, indent=2))
+        print_json(output, indent=True)
     else:
         display_holdings(holdings, crypto_prices)
 
@@ -308,25 +329,31 @@ def cmd_parse(args):
     if not pdf_path.exists():
         result = {"success": False, "error": f"File not found: {pdf_path}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(f"Error: {result['error']}", file=sys.stderr)
         return 1
 
-    if is_sofi_apex_statement(str(pdf_path)):
-        try:
-            data = parse_statement(str(pdf_path))
-        except Exception as e:
-            result = {"success": False, "error": f"Failed to parse statement: {e}"}
-            if args.json:
-                print(json.dumps(result))
-            else:
-                print(f"Error: {result['error']}", file=sys.stderr)
-            return 1
-    else:
+    from parsers.sofi_apex import open_statement, parse_statement_document
+
+    # One open serves both detection and parsing
+    data = None
+    try:
+        with open_statement(str(pdf_path)) as (pdf, is_sofi):
+            if is_sofi:
+                data = parse_statement_document(pdf)
+    except Exception as e:
+        result = {"success": False, "error": f"Failed to parse statement: {e}"}
+        if args.json:
+            print_json(result)
+        else:
+            print(f"Error: {result['error']}", file=sys.stderr)
+        return 1
+
+    if data is None:
         result = {"success": False, "error": "Unsupported statement format (only SoFi/Apex currently supported)"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(f"Error: {result['error']}", file=sys.stderr)
         return 1
@@ -345,11 +372,10 @@ def cmd_parse(args):
     }
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
     else:
-        print()
-        print(format_header(f"Statement Parsed: {pdf_path.name}"))
-        print()
+        # Output is collected and written once
+        out = ["", format_header(f"Statement Parsed: {pdf_path.name}"), ""]
 
         account_holder = data.get('account_holder') or 'Unknown'
         account_type = (data.get('account_type') or 'Unknown').replace('_', ' ').title()
@@ -358,63 +384,68 @@ def cmd_parse(args):
         total_value = data['portfolio']['total_value']
         holdings_count = len(data['portfolio']['holdings'])
 
+        from tabulate import tabulate
+
         info = [
             ["Account", f"{account_holder} - {account_type}"],
             ["Period", f"{period_start} to {period_end}"],
             ["Total Value", f"{Fore.GREEN}${total_value:,.2f}{Style.RESET_ALL}"],
             ["Holdings", str(holdings_count)],
         ]
-        print(tabulate(info, tablefmt="plain"))
-        print()
+        out.append(tabulate(info, tablefmt="plain"))
+        out.append("")
 
-        print(format_success(f"Snapshot saved: {snapshot_path.name}"))
+        out.append(format_success(f"Snapshot saved: {snapshot_path.name}"))
         if template_updated:
-            print(format_success(f"Template updated: {TEMPLATE_PATH.name}"))
-        print()
+            out.append(format_success(f"Template updated: {TEMPLATE_PATH.name}"))
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
     return 0
 
 
 def cmd_history(args):
     """List historical snapshots."""
-    snapshots = load_snapshots(args.account)
-
-    if not snapshots:
-        result = {"success": True, "snapshots": [], "count": 0}
-        if args.json:
-            print(json.dumps(result))
-        else:
-            print(f"{Style.DIM}No snapshots found.{Style.RESET_ALL}")
-        return 0
-
     if args.json:
+        snapshots = load_snapshots(args.account)
+        if not snapshots:
+            print_json({"success": True, "snapshots": [], "count": 0})
+            return 0
         for s in snapshots:
             s.pop("_filepath", None)
         result = {"success": True, "snapshots": snapshots, "count": len(snapshots)}
-        print(json.dumps(result, indent=2))
-    else:
-        print()
-        print(format_header(f"Financial History ({len(snapshots)} snapshots)"))
-        print()
+        print_json(result, indent=True)
+        return 0
 
-        table_data = []
-        for snap in snapshots:
-            date = snap.get("statement_date") or "Unknown"
-            account = (snap.get("account_type") or "Unknown").replace('_', ' ').title()
-            total = snap.get("portfolio", {}).get("total_value", 0)
-            table_data.append([
-                date,
-                account,
-                f"{Fore.GREEN}${total:>12,.2f}{Style.RESET_ALL}"
-            ])
+    # Only three fields are displayed, so stream summaries rather than
+    # loading every snapshot
+    table_data = []
+    for date, account, total in iter_snapshot_summaries(args.account):
+        table_data.append([
+            date or "Unknown",
+            (account or "Unknown").replace('_', ' ').title(),
+            f"${total:,.2f}"
+        ])
+
+    if not table_data:
+        print(f"{DIM}No snapshots found.{RESET}")
+        return 0
 
-        headers = [
-            f"{Style.DIM}Date{Style.RESET_ALL}",
-            f"{Style.DIM}Account{Style.RESET_ALL}",
-            f"{Style.DIM}Total Value{Style.RESET_ALL}"
-        ]
-        print(tabulate(table_data, headers=headers, tablefmt="plain"))
-        print()
+    from tabulate import tabulate
+
+    # Output is collected and written once
+    out = ["", format_header(f"Financial History ({len(table_data)} snapshots)"), ""]
+
+    # Cells are plain text so tabulate measures them without stripping ANSI
+    # codes; color is applied to the rendered table in one pass
+    table = tabulate(table_data, headers=("Date", "Account", "Total Value"),
+                     tablefmt="plain", colalign=("left", "left", "right"),
+                     disable_numparse=True)
+    header, _, body = table.partition("\n")
+    out.append(f"{DIM}{header}{RESET}")
+    out.append(_MONEY_CELL_RE.sub(f"{GREEN}\\1{RESET}", body))
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
     return 0
 
@@ -426,7 +457,7 @@ def cmd_summary(args):
     if not latest:
         result = {"success": False, "error": "No snapshots found"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error("No snapshots found. Run 'finance parse <statement.pdf>' first."))
         return 1
@@ -434,16 +465,21 @@ def cmd_summary(args):
     if args.json:
         latest.pop("_filepath", None)
         result = {"success": True, "data": latest}
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
     else:
+        from tabulate import tabulate
+
         account_holder = latest.get('account_holder') or 'Unknown'
         account_type = (latest.get('account_type') or 'Unknown').replace('_', ' ').title()
         statement_date = latest.get('statement_date') or 'Unknown'
 
-        print()
-        print(format_header("Portfolio Summary"))
-        print(f"{Style.DIM}{account_holder} - {account_type} | As of {statement_date}{Style.RESET_ALL}")
-        print()
+        # Output is collected and written once
+        out = [
+            "",
+            format_header("Portfolio Summary"),
+            f"{DIM}{account_holder} - {account_type} | As of {statement_date}{RESET}",
+            "",
+        ]
 
         portfolio = latest.get("portfolio", {})
         total_value = portfolio.get('total_value', 0)
@@ -451,20 +487,19 @@ def cmd_summary(args):
         fdic_deposits = portfolio.get('fdic_deposits', 0)
 
         totals_data = [
-            [f"{Fore.WHITE}{Style.BRIGHT}Total Value{Style.RESET_ALL}", f"{Fore.GREEN}{Style.BRIGHT}${total_value:>12,.2f}{Style.RESET_ALL}"],
-            [f"{Style.DIM}Securities{Style.RESET_ALL}", f"${securities_value:>12,.2f}"],
-            [f"{Style.DIM}FDIC Deposits{Style.RESET_ALL}", f"${fdic_deposits:>12,.2f}"],
+            [f"{WHITE}{BRIGHT}Total Value{RESET}", f"{GREEN}{BRIGHT}${total_value:>12,.2f}{RESET}"],
+            [f"{DIM}Securities{RESET}", f"${securities_value:>12,.2f}"],
+            [f"{DIM}FDIC Deposits{RESET}", f"${fdic_deposits:>12,.2f}"],
         ]
-        print(tabulate(totals_data, tablefmt="plain"))
-        print()
+        out.append(tabulate(totals_data, tablefmt="plain"))
+        out.append("")
 
         holdings = portfolio.get("holdings", [])
         if holdings:
-            print(format_header("Holdings"))
-            print()
+            out += [format_header("Holdings"), ""]
 
             holdings_data = []
-            for h in sorted(holdings, key=lambda x: x.get("value", 0), reverse=True):
+            for h in sorted(holdings, key=itemgetter("value"), reverse=True):
                 symbol = h['symbol']
                 name = h.get('name', '')[:25]
                 value = h.get('value', 0)
@@ -473,45 +508,44 @@ def cmd_summary(args):
                 price = h.get('price', 0)
 
                 holdings_data.append([
-                    f"{Fore.YELLOW}{symbol}{Style.RESET_ALL}",
-                    f"{Style.DIM}{name}{Style.RESET_ALL}",
+                    symbol,
+                    name,
                     f"{qty:,.2f}",
                     f"${price:,.2f}",
-                    f"{Fore.GREEN}${value:>10,.2f}{Style.RESET_ALL}",
+                    f"${value:,.2f}",
                     f"{pct:>5.1f}%"
                 ])
 
-            headers = [
-                f"{Style.DIM}Symbol{Style.RESET_ALL}",
-                f"{Style.DIM}Name{Style.RESET_ALL}",
-                f"{Style.DIM}Qty{Style.RESET_ALL}",
-                f"{Style.DIM}Price{Style.RESET_ALL}",
-                f"{Style.DIM}Value{Style.RESET_ALL}",
-                f"{Style.DIM}%{Style.RESET_ALL}"
-            ]
-            print(tabulate(holdings_data, headers=headers, tablefmt="plain"))
-            print()
+            table = tabulate(holdings_data, headers=("Symbol", "Name", "Qty", "Price", "Value", "%"),
+                             tablefmt="plain", colalign=("left", "left", "decimal", "left", "right", "left"),
+                             disable_numparse=True)
+            header, _, body = table.partition("\n")
+            out.append(f"{DIM}{header}{RESET}")
+            out.append(_HOLDING_ROW_RE.sub(f"{YELLOW}\\1{RESET}\\2{DIM}\\3{RESET}\\4{GREEN}\\5{RESET}\\6", body))
+            out.append("")
 
         income = latest.get("income", {})
         dividends_ytd = income.get('dividends', {}).get('ytd', 0)
         interest_ytd = income.get('interest', {}).get('ytd', 0)
 
         if dividends_ytd > 0 or interest_ytd > 0:
-            print(format_header("Income (YTD)"))
-            print()
+            out += [format_header("Income (YTD)"), ""]
             income_data = []
             if dividends_ytd > 0:
-                income_data.append(["Dividends", f"{Fore.GREEN}${dividends_ytd:>10,.2f}{Style.RESET_ALL}"])
+                income_data.append(["Dividends", f"{GREEN}${dividends_ytd:>10,.2f}{RESET}"])
             if interest_ytd > 0:
-                income_data.append(["Interest", f"{Fore.GREEN}${interest_ytd:>10,.2f}{Style.RESET_ALL}"])
-            print(tabulate(income_data, tablefmt="plain"))
-            print()
+                income_data.append(["Interest", f"{GREEN}${interest_ytd:>10,.2f}{RESET}"])
+            out.append(tabulate(income_data, tablefmt="plain"))
+            out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
     return 0
 
 
 def _process_single_statement(source_pdf: Path, quiet: bool = False) -> dict:
     """Move, parse, and save a single statement."""
+    from parsers.sofi_apex import parse_statement
+
     STATEMENTS_DIR.mkdir(parents=True, exist_ok=True)
     dest_pdf = STATEMENTS_DIR / source_pdf.name
 
@@ -546,6 +580,8 @@ def _process_single_statement(source_pdf: Path, quiet: bool = False) -> dict:
 
 def _display_statement_summary(data: dict):
     """Display a formatted summary of a parsed statement."""
+    from tabulate import tabulate
+
     account_holder = data.get('account_holder') or 'Unknown'
     account_type = (data.get('account_type') or 'Unknown').replace('_', ' ').title()
     statement_date = data.get('statement_date') or 'Unknown'
@@ -573,7 +609,7 @@ def _display_statement_summary(data: dict):
         print()
 
         holdings_data = []
-        for h in sorted(holdings, key=lambda x: x.get("value", 0), reverse=True):
+        for h in sorted(holdings, key=itemgetter("value"), reverse=True):
             symbol = h['symbol']
             name = h.get('name', '')[:25]
             value = h.get('value', 0)
@@ -609,11 +645,13 @@ def cmd_pull(args):
     if not downloads_dir.exists():
         result = {"success": False, "error": f"Downloads directory not found: {downloads_dir}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
 
+    from parsers.sofi_apex import is_sofi_apex_statement
+
     pdf_files = list(downloads_dir.glob("*.pdf"))
     statements = []
 
@@ -627,7 +665,7 @@ def cmd_pull(args):
     if not statements:
         result = {"success": False, "error": "No SoFi/Apex statements found in Downloads. Download a statement first."}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -673,7 +711,7 @@ def cmd_pull(args):
         if len(to_process) == 1:
             result = results[0]
             result["template_updated"] = template_updated
-            print(json.dumps(result, indent=2))
+            print_json(result, indent=True)
         else:
             batch_result = {
                 "success": len(errors) == 0,
@@ -682,7 +720,7 @@ def cmd_pull(args):
                 "template_updated": template_updated,
                 "errors": errors
             }
-            print(json.dumps(batch_result, indent=2))
+            print_json(batch_result, indent=True)
     else:
         for result in results:
             if result["success"]:
@@ -701,7 +739,7 @@ def cmd_portfolio(args):
     )
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
         return 0 if result["success"] else 1
 
     if not result["success"]:
@@ -800,7 +838,7 @@ def cmd_advise(args):
     result = get_advice(focus)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
         return 0 if result.get("success") else 1
 
     if not result.get("success"):
@@ -1106,7 +1144,7 @@ def _cmd_db_start(args):
     if not compose_file.exists():
         result = {"success": False, "error": f"docker-compose.yml not found: {compose_file}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1120,7 +1158,7 @@ def _cmd_db_start(args):
         )
         result = {"success": True, "message": "PostgreSQL container started"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_success(result["message"]))
             print(f"{Style.DIM}Run 'finance db status' to verify connection{Style.RESET_ALL}")
@@ -1128,14 +1166,14 @@ def _cmd_db_start(args):
     except subprocess.CalledProcessError as e:
         result = {"success": False, "error": f"Failed to start container: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
     except FileNotFoundError:
         result = {"success": False, "error": "Docker not found. Install Docker Desktop first."}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1152,14 +1190,14 @@ def _cmd_db_stop(args):
         )
         result = {"success": True, "message": "PostgreSQL container stopped"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_success(result["message"]))
         return 0
     except subprocess.CalledProcessError as e:
         result = {"success": False, "error": f"Failed to stop container: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1172,7 +1210,7 @@ def _cmd_db_status(args):
     except ImportError as e:
         result = {"success": False, "error": f"Database module not available: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1182,7 +1220,7 @@ def _cmd_db_status(args):
     if args.json:
         if status["connected"]:
             status["table_counts"] = get_table_counts()
-        print(json.dumps(status, indent=2))
+        print_json(status, indent=True)
         return 0 if status["connected"] else 1
 
     print()
@@ -1223,7 +1261,7 @@ def _cmd_db_migrate(args):
     except ImportError as e:
         result = {"success": False, "error": f"Database module not available: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1233,7 +1271,7 @@ def _cmd_db_migrate(args):
     if not status["connected"]:
         result = {"success": False, "error": f"Database not connected: {status.get('error')}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
             print(f"{Style.DIM}Run 'finance db start' first{Style.RESET_ALL}")
@@ -1247,7 +1285,7 @@ def _cmd_db_migrate(args):
     except Exception as e:
         result = {"success": False, "error": f"Migration failed: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1258,7 +1296,7 @@ def _cmd_db_migrate(args):
     }
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
     else:
         print()
         print(format_header("Migration Complete"))
@@ -1291,7 +1329,7 @@ def _cmd_db_export(args):
     except ImportError as e:
         result = {"success": False, "error": f"Database module not available: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1301,7 +1339,7 @@ def _cmd_db_export(args):
     if not status["connected"]:
         result = {"success": False, "error": f"Database not connected: {status.get('error')}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1314,7 +1352,7 @@ def _cmd_db_export(args):
     except Exception as e:
         result = {"success": False, "error": f"Export failed: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
@@ -1322,7 +1360,7 @@ def _cmd_db_export(args):
     # Save to export file
     export_path = REPO_ROOT / ".data" / "finance" / "db_export.json"
     export_path.parent.mkdir(parents=True, exist_ok=True)
-    export_path.write_text(json.dumps(data, indent=2, default=str))
+    export_path.write_text(dumps(data, indent=True, default=str))
 
     result = {
         "success": True,
@@ -1337,7 +1375,7 @@ def _cmd_db_export(args):
     }
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print_json(result, indent=True)
     else:
         print()
         print(format_success(f"Exported to: {export_path}"))
@@ -1376,7 +1414,7 @@ def _cmd_db_reset(args):
         )
         result = {"success": True, "message": "Database reset complete"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_success(result["message"]))
             print(f"{Style.DIM}Run 'finance db migrate' to re-import data{Style.RESET_ALL}")
@@ -1384,7 +1422,7 @@ def _cmd_db_reset(args):
     except subprocess.CalledProcessError as e:
         result = {"success": False, "error": f"Reset failed: {e}"}
         if args.json:
-            print(json.dumps(result))
+            print_json(result)
         else:
             print(format_error(result["error"]))
         return 1
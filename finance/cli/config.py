@@ -12,7 +12,6 @@ DATA_DIR = REPO_ROOT / ".data" / "finance"
 SNAPSHOTS_DIR = DATA_DIR / "snapshots"
 TEMPLATE_PATH = REPO_ROOT / "finance" / "templates" / "FINANCIAL_PLANNING_PROMPT.md"
 STATEMENTS_DIR = REPO_ROOT / "personal" / "finance" / "statements"
-LOCK_FILE = DATA_DIR / ".lock"
 PROFILE_PATH = REPO_ROOT / ".config" / "finance-profile.json"
 HOLDINGS_PATH = REPO_ROOT / ".config" / "holdings.json"
 
@@ -38,7 +38,7 @@ from commands import (
 )
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Finance CLI for parsing statements and managing financial planning"
     )
@@ -145,7 +145,7 @@ def main():
     db_reset_parser = db_subparsers.add_parser("reset", help="Reset database (delete all data)")
     db_reset_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "parse":
         return cmd_parse(args)
@@ -7,13 +7,16 @@ from colorama import Fore, Style, init as colorama_init
 # Initialize colorama
 colorama_init()
 
+# ANSI codes resolved once for the per-row formatting paths
+GREEN, RED, CYAN, YELLOW, WHITE = Fore.GREEN, Fore.RED, Fore.CYAN, Fore.YELLOW, Fore.WHITE
+DIM, BRIGHT, RESET = Style.DIM, Style.BRIGHT, Style.RESET_ALL
+
 
 def format_dollars(value: float, width: int = 12) -> str:
     """Format a dollar value with color (green for positive)."""
-    formatted = f"${value:>{width},.2f}"
     if value > 0:
-        return f"{Fore.GREEN}{formatted}{Style.RESET_ALL}"
-    return formatted
+        return f"{GREEN}${value:>{width},.2f}{RESET}"
+    return f"${value:>{width},.2f}"
 
 
 def format_pct(value: float, width: int = 6) -> str:
@@ -23,19 +26,19 @@ def format_pct(value: float, width: int = 6) -> str:
 
 def format_header(text: str) -> str:
     """Format a section header."""
-    return f"{Fore.CYAN}{Style.BRIGHT}{text}{Style.RESET_ALL}"
+    return f"{CYAN}{BRIGHT}{text}{RESET}"
 
 
 def format_label(text: str) -> str:
     """Format a label (dimmed)."""
-    return f"{Style.DIM}{text}{Style.RESET_ALL}"
+    return f"{DIM}{text}{RESET}"
 
 
 def format_success(text: str) -> str:
     """Format success message."""
-    return f"{Fore.GREEN}\u2713{Style.RESET_ALL} {text}"
+    return f"{GREEN}\u2713{RESET} {text}"
 
 
 def format_error(text: str) -> str:
     """Format error message."""
-    return f"{Fore.RED}\u2717{Style.RESET_ALL} {text}"
+    return f"{RED}\u2717{RESET} {text}"
@@ -13,7 +13,6 @@ from threading import Lock
 
 import requests
 from colorama import Fore, Style
-from tabulate import tabulate
 
 from config import (
     HOLDINGS_PATH,
@@ -379,6 +378,8 @@ def build_holdings_json(holdings: dict, crypto_prices: dict) -> dict:
 
 def display_holdings(holdings: dict, crypto_prices: dict) -> None:
     """Display all holdings with current values."""
+    from tabulate import tabulate
+
     print()
     print(format_header("Holdings"))
     last_updated = holdings.get("last_updated", "Never")
@@ -0,0 +1,37 @@
+"""
+JSON helpers for the finance CLI.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch it either way
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False, default=None) -> str:
+    """Serialize obj to a JSON string, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=default)
+
+
+def print_json(obj, indent: bool = False) -> None:
+    """Print obj as JSON to stdout."""
+    print(dumps(obj, indent=indent))
@@ -4,79 +4,284 @@ SoFi/Apex Clearing statement parser.
 Parses monthly brokerage statements from SoFi (cleared by Apex).
 """
 
+import os
 import re
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from datetime import date
 from decimal import Decimal
 from typing import Optional
-import pdfplumber
 
 
-def parse_statement(pdf_path: str) -> dict:
+# Compiled once at import; these run against every statement page
+
+# Page markers that decide which section extractors run
+_MARKER_RE = re.compile(
+    r'ACCOUNT NUMBER|PAGE 1 OF|OPENING BALANCE|EQUITIES / OPTIONS|PORTFOLIO SUMMARY'
+    r'|ROLLOVER CONTRIBUTION|ROTH CONVERSION'
+)
+
+# Account number pattern: 2FV-75567-14 or similar
+_ACCT_RE = re.compile(r'ACCOUNT NUMBER\s+(\d*[A-Z]+-\d+-\d+)')
+
+# Account holder name - look for name before or near "APEX C/F"
+_HOLDER_RE_A = re.compile(r'([A-Z][A-Z]+\s+[A-Z]+)\s*\n.*APEX C/F', re.MULTILINE)
+_HOLDER_RE_B = re.compile(r'([A-Z][A-Z]+\s+[A-Z]+)\s+APEX C/F')
+
+# Statement period - pattern: "December 1, 2025 - December 31, 2025"
+_PERIOD_RE = re.compile(r'([A-Z][a-z]+\s+\d+,?\s+\d{4})\s*[-–]\s*([A-Z][a-z]+\s+\d+,?\s+\d{4})')
+
+# Account summary: opening and closing values, e.g. "TOTAL PRICED PORTFOLIO 61,580.91 68,340.45"
+_TOTAL_RE = re.compile(r'TOTAL PRICED PORTFOLIO\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)')
+_FDIC_RE = re.compile(r'FDIC Insured Deposits\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)')
+_SEC_RE = re.compile(r'Securities\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)')
+
+# Income (period, ytd): "Dividends $196.81 $302.42", "Bank Interest 0.01 0.16"
+_DIV_RE = re.compile(r'Dividends\s+\$?([\d,]+\.?\d*)\s+\$?([\d,]+\.?\d*)')
+_INT_RE = re.compile(r'Bank Interest\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)')
+
+# Retirement: "ROLLOVER CONTRIBUTION 2025 XX,XXX.XX", "ROTH CONVERSION AMOUNT 2025 X,XXX.XX"
+_ROLLOVER_RE = re.compile(r'ROLLOVER CONTRIBUTION\s+(\d{4})\s+([\d,]+\.?\d*)')
+_CONV_RE = re.compile(r'ROTH CONVERSION AMOUNT\s+(\d{4})\s+([\d,]+\.?\d*)')
+# Regular contributions (but not ROLLOVER CONTRIBUTION - use negative lookbehind)
+_CONTRIB_RE = re.compile(r'(?<!ROLLOVER )CONTRIBUTION\s+(\d{4})\s+([\d,]+\.?\d*)')
+
+# Pattern for holdings line:
+# "ARKK C 0.07199 $76.92 $5.54" or "QQQ C 49.89102 614.31 30,648.55"
+# Symbol, account type (C/O), quantity, price, market value
+_HOLDINGS_RE = re.compile(
+    r'\b([A-Z]{2,5})\s+'  # Symbol (2-5 uppercase letters)
+    r'([CO])\s+'  # Account type (C=Cash, O=Other/On-loan)
+    r'([\d.]+)\s+'  # Quantity
+    r'\$?([\d,]+\.?\d*)\s+'  # Price
+    r'\$?([\d,]+\.?\d*)',  # Market value
+    re.MULTILINE
+)
+# Known valid symbols to avoid false positives
+_VALID_SYMBOLS = frozenset({
+    "ARKK", "QQQ", "VUG", "VB", "VWO", "VOO", "VTI", "SPY", "IVV",
+    "SCHD", "VYM", "VXUS", "BND", "AGG", "VTIP", "VGSH", "VCIT",
+    "VNQ", "VGT", "VHT", "VDC", "VPU", "AAPL", "MSFT", "GOOGL",
+    "AMZN", "NVDA", "META", "TSLA", "BRK", "JPM", "V", "HD", "ISPAZ"
+})
+
+# Words that look like symbols but aren't
+_INVALID_SYMBOLS = frozenset({"THE", "AND", "FOR", "ETF", "SER", "PAY", "REC", "DIV"})
+
+# Full names for common symbols (anything else is shown by its symbol)
+_HOLDING_NAMES = {
+    "ARKK": "ARK Innovation ETF",
+    "QQQ": "Invesco QQQ Trust",
+    "VUG": "Vanguard Growth ETF",
+    "VB": "Vanguard Small-Cap ETF",
+    "VWO": "Vanguard FTSE Emerging Markets ETF",
+    "VOO": "Vanguard S&P 500 ETF",
+    "VTI": "Vanguard Total Stock Market ETF",
+    "SPY": "SPDR S&P 500 ETF",
+    "IVV": "iShares Core S&P 500 ETF",
+    "SCHD": "Schwab US Dividend Equity ETF",
+    "VYM": "Vanguard High Dividend Yield ETF",
+    "VXUS": "Vanguard Total International Stock ETF",
+    "BND": "Vanguard Total Bond Market ETF",
+    "AGG": "iShares Core US Aggregate Bond ETF",
+}
+
+# Characters stripped from money/number strings before float()
+_MONEY_TABLE = str.maketrans("", "", "$,")
+_NUMBER_TABLE = str.maketrans("", "", ",")
+
+# With parallel=True, statements at least this long have their pages
+# extracted in worker processes. Monthly statements are well under this;
+# below it, pool start-up (each worker re-imports pdfplumber and reopens
+# the PDF) costs more than it saves.
+PARALLEL_MIN_PAGES = 40
+
+# Month name -> number for statement period dates (cheaper than strptime)
+_MONTHS = {
+    name: i for i, name in enumerate(
+        ["January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"], 1)
+}
+
+
+def parse_statement(pdf_path: str, parallel: bool = False) -> dict:
     """
     Parse a SoFi/Apex brokerage statement PDF.
 
     Args:
         pdf_path: Path to the PDF file
+        parallel: Extract pages of long statements in a process pool.
+            Off by default: pages are extracted lazily in this process,
+            which is also what long-lived callers (the MCP server) need.
 
     Returns:
         Dictionary with extracted statement data
     """
+    import pdfplumber  # slow to import; only needed when a PDF is opened
+
+    # Page 0 usually comes from the cache filled by is_sofi_apex_statement()
+    n_pages, first_page = _statement_first_page(pdf_path)
+    if not parallel or n_pages < PARALLEL_MIN_PAGES:
+        with pdfplumber.open(pdf_path) as pdf:
+            return _parse_page_texts(chain([first_page], map(_page_text, pdf.pages[1:n_pages])))
+
+    # extract_text() is CPU-bound layout analysis and pages are independent,
+    # so split the rest into contiguous ranges, one per worker process
+    workers = min(os.cpu_count() or 1, n_pages - 1)
+    step = -(-(n_pages - 1) // workers)
+    ranges = [(start, min(start + step, n_pages)) for start in range(1, n_pages, step)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+            chunks = ex.map(_extract_page_texts, [pdf_path] * len(ranges), *zip(*ranges))
+            texts = [first_page] + [text for chunk in chunks for text in chunk]
+    except (OSError, RuntimeError):
+        # No process support here (e.g. sandboxed); extract sequentially
+        with pdfplumber.open(pdf_path) as pdf:
+            return _parse_page_texts(chain([first_page], map(_page_text, pdf.pages[1:])))
+    return _parse_page_texts(texts)
+
+
+def _statement_first_page(pdf_path: str) -> tuple:
+    """Return (page count, page 0 text), cached per file version."""
+    st = os.stat(pdf_path)
+    return _first_page_text(str(pdf_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _first_page_text(pdf_path: str, mtime_ns: int, size: int) -> tuple:
+    """Open a PDF and extract page 0; mtime/size in the key invalidate stale entries."""
+    import pdfplumber
+
     with pdfplumber.open(pdf_path) as pdf:
-        result = {
-            "statement_date": None,
-            "account_type": None,
-            "account_id": None,
-            "account_holder": None,
-            "period": {"start": None, "end": None},
-            "portfolio": {
-                "total_value": 0,
-                "securities_value": 0,
-                "fdic_deposits": 0,
-                "holdings": []
-            },
-            "income": {
-                "dividends": {"period": 0, "ytd": 0},
-                "interest": {"period": 0, "ytd": 0}
-            },
-            "retirement": {}
-        }
+        if not pdf.pages:
+            return 0, ""
+        return len(pdf.pages), pdf.pages[0].extract_text() or ""
+
+
+def _extract_page_texts(pdf_path: str, start: int, stop: int) -> list:
+    """Worker: extract the text of pages [start, stop) of a PDF."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_page_text(pdf.pages[i]) for i in range(start, stop)]
+
+
+@contextmanager
+def open_statement(pdf_path: str):
+    """
+    Open a PDF once for both detection and parsing.
+
+    Yields (pdf, is_sofi) where pdf is the open pdfplumber document.
+    """
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        try:
+            is_sofi = is_sofi_apex_document(pdf)
+        except Exception:
+            is_sofi = False
+        yield pdf, is_sofi
+
+
+def parse_statement_document(pdf) -> dict:
+    """Parse an already-open SoFi/Apex statement (see parse_statement)."""
+    # Lazy: pages are extracted one at a time as the parser reaches them
+    return _parse_page_texts(_page_text(page) for page in pdf.pages)
+
+
+def _page_text(page) -> str:
+    """Extract a page's text, skipping layout analysis on pages with no text."""
+    if not _page_may_have_text(page):
+        return ""
+    return page.extract_text() or ""
+
+
+def _page_may_have_text(page) -> bool:
+    """
+    Cheap check on the raw content stream before running extract_text().
+
+    Only pages with no text objects (BT) and no form XObjects (Do) are
+    ruled out. Matching the section markers themselves at the byte level
+    isn't safe: strings can be kerned into pieces or use CID fonts.
+    """
+    from pdfminer.pdftypes import resolve1
 
-        # Find statement pages by looking for "PAGE X OF" pattern
-        for i, page in enumerate(pdf.pages):
-            text = page.extract_text() or ""
+    try:
+        for stream in page.page_obj.contents:
+            data = resolve1(stream).get_data()
+            if b"BT" in data or b"Do" in data:
+                return True
+    except Exception:
+        return True
+    return False
+
+
+def _parse_page_texts(texts) -> dict:
+    """Run the section extractors over page texts, in page order."""
+    result = {
+        "statement_date": None,
+        "account_type": None,
+        "account_id": None,
+        "account_holder": None,
+        "period": {"start": None, "end": None},
+        "portfolio": {
+            "total_value": 0,
+            "securities_value": 0,
+            "fdic_deposits": 0,
+            "holdings": []
+        },
+        "income": {
+            "dividends": {"period": 0, "ytd": 0},
+            "interest": {"period": 0, "ytd": 0}
+        },
+        "retirement": {}
+    }
+
+    # Account info and the summary come from one page each, so stop looking
+    # once found. Holdings and retirement lines can continue onto later
+    # pages, so their extractors see every statement page.
+    got_account = got_summary = False
 
-            # Skip pages without statement content
-            if "ACCOUNT NUMBER" not in text:
-                continue
+    # Find statement pages by looking for "PAGE X OF" pattern
+    for text in texts:
+        # One scan finds every section marker on the page
+        markers = set(_MARKER_RE.findall(text))
 
-            # Extract account info from first statement page found
-            if result["account_id"] is None:
-                _extract_account_info(text, result)
+        # Skip pages without statement content
+        if "ACCOUNT NUMBER" not in markers:
+            continue
+
+        # Extract account info from first statement page found
+        if not got_account:
+            _extract_account_info(text, result)
+            got_account = result["account_id"] is not None
 
-            # Page 1 has account summary with totals and income
-            if "PAGE 1 OF" in text or "OPENING BALANCE" in text:
-                _extract_account_summary(text, result)
+        # Page 1 has account summary with totals and income
+        if not got_summary and ("PAGE 1 OF" in markers or "OPENING BALANCE" in markers):
+            got_summary = _extract_account_summary(text, result)
 
-            # Page 3 has portfolio holdings
-            if "EQUITIES / OPTIONS" in text or "PORTFOLIO SUMMARY" in text:
-                _extract_holdings_from_text(text, result)
+        # Page 3 has portfolio holdings
+        if "EQUITIES / OPTIONS" in markers or "PORTFOLIO SUMMARY" in markers:
+            _extract_holdings_from_text(text, result)
 
-            # Look for retirement info
-            if "ROLLOVER CONTRIBUTION" in text or "ROTH CONVERSION" in text:
-                _extract_retirement_info(text, result)
+        # Look for retirement info
+        if "ROLLOVER CONTRIBUTION" in markers or "ROTH CONVERSION" in markers:
+            _extract_retirement_info(text, result)
 
-        # Set statement date from period end
-        if result["period"]["end"]:
-            result["statement_date"] = result["period"]["end"]
+    # Set statement date from period end
+    if result["period"]["end"]:
+        result["statement_date"] = result["period"]["end"]
 
-        return result
+    return result
 
 
 def _extract_account_info(text: str, result: dict) -> None:
     """Extract account number, holder, type, and period from text."""
 
-    # Account number pattern: 2FV-75567-14 or similar
-    account_match = re.search(r'ACCOUNT NUMBER\s+(\d*[A-Z]+-\d+-\d+)', text)
+    account_match = _ACCT_RE.search(text)
     if account_match:
         full_account = account_match.group(1)
         parts = full_account.split("-")
@@ -84,71 +289,79 @@ def _extract_account_info(text: str, result: dict) -> None:
         result["account_id"] = parts[0] + "-" + parts[1][:2] + "XXX"
 
     # Account holder name - look for name before or near "APEX C/F"
-    holder_match = re.search(r'([A-Z][A-Z]+\s+[A-Z]+)\s*\n.*APEX C/F', text, re.MULTILINE)
+    holder_match = _HOLDER_RE_A.search(text)
     if not holder_match:
-        holder_match = re.search(r'([A-Z][A-Z]+\s+[A-Z]+)\s+APEX C/F', text)
+        holder_match = _HOLDER_RE_B.search(text)
     if holder_match:
         result["account_holder"] = holder_match.group(1).strip()
 
     # Account type from APEX C/F line
-    if "ROTH IRA" in text.upper():
+    upper = text.upper()
+    if "ROTH IRA" in upper:
         result["account_type"] = "roth_ira"
-    elif "TRADITIONAL IRA" in text.upper():
+    elif "TRADITIONAL IRA" in upper:
         result["account_type"] = "traditional_ira"
-    elif "IRA" in text.upper():
+    elif "IRA" in upper:
         result["account_type"] = "ira"
     else:
         result["account_type"] = "brokerage"
 
     # Statement period - pattern: "December 1, 2025 - December 31, 2025"
-    period_match = re.search(
-        r'([A-Z][a-z]+\s+\d+,?\s+\d{4})\s*[-–]\s*([A-Z][a-z]+\s+\d+,?\s+\d{4})',
-        text
-    )
+    period_match = _PERIOD_RE.search(text)
     if period_match:
-        try:
-            start_str = period_match.group(1).replace(",", "")
-            end_str = period_match.group(2).replace(",", "")
-            start_date = datetime.strptime(start_str, "%B %d %Y")
-            end_date = datetime.strptime(end_str, "%B %d %Y")
-            result["period"]["start"] = start_date.strftime("%Y-%m-%d")
-            result["period"]["end"] = end_date.strftime("%Y-%m-%d")
-        except ValueError:
-            pass
+        start = _iso_date(period_match.group(1))
+        end = _iso_date(period_match.group(2))
+        if start and end:
+            result["period"]["start"] = start
+            result["period"]["end"] = end
 
 
-def _extract_account_summary(text: str, result: dict) -> None:
-    """Extract account summary values from page 1."""
+def _iso_date(value: str) -> Optional[str]:
+    """Convert "December 31, 2025" to "2025-12-31", or None if it isn't a real date."""
+    try:
+        month, day, year = value.replace(",", "").split()
+        return date(int(year), _MONTHS[month], int(day)).isoformat()
+    except (ValueError, KeyError):
+        return None
+
+
+def _extract_account_summary(text: str, result: dict) -> bool:
+    """Extract account summary values from page 1.
+
+    Returns True once the TOTAL PRICED PORTFOLIO line has been found.
+    """
 
     # TOTAL PRICED PORTFOLIO: opening and closing values
     # Pattern: "TOTAL PRICED PORTFOLIO 61,580.91 68,340.45"
-    total_match = re.search(r'TOTAL PRICED PORTFOLIO\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)', text)
+    total_match = _TOTAL_RE.search(text)
     if total_match:
         result["portfolio"]["total_value"] = _parse_money(total_match.group(2))  # closing
 
     # FDIC Insured Deposits
-    fdic_match = re.search(r'FDIC Insured Deposits\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)', text)
+    fdic_match = _FDIC_RE.search(text)
     if fdic_match:
         result["portfolio"]["fdic_deposits"] = _parse_money(fdic_match.group(2))  # closing
 
     # Securities value
-    securities_match = re.search(r'Securities\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)', text)
+    securities_match = _SEC_RE.search(text)
     if securities_match:
         result["portfolio"]["securities_value"] = _parse_money(securities_match.group(2))  # closing
 
     # Income: Dividends and Interest
     # Pattern: "Dividends $196.81 $302.42" (period, ytd)
-    div_match = re.search(r'Dividends\s+\$?([\d,]+\.?\d*)\s+\$?([\d,]+\.?\d*)', text)
+    div_match = _DIV_RE.search(text)
     if div_match:
         result["income"]["dividends"]["period"] = _parse_money(div_match.group(1))
         result["income"]["dividends"]["ytd"] = _parse_money(div_match.group(2))
 
     # Pattern: "Bank Interest 0.01 0.16" (period, ytd)
-    int_match = re.search(r'Bank Interest\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)', text)
+    int_match = _INT_RE.search(text)
     if int_match:
         result["income"]["interest"]["period"] = _parse_money(int_match.group(1))
         result["income"]["interest"]["ytd"] = _parse_money(int_match.group(2))
 
+    return total_match is not None
+
 
 def _extract_holdings_from_text(text: str, result: dict) -> None:
     """Extract individual holdings from portfolio text."""
@@ -158,36 +371,13 @@ def _extract_holdings_from_text(text: str, result: dict) -> None:
         return
 
     # Aggregate holdings by symbol (same ticker can appear in C and O accounts)
-    holdings_map = {}
-
-    # Pattern for holdings line:
-    # "ARKK C 0.07199 $76.92 $5.54" or "QQQ C 49.89102 614.31 30,648.55"
-    # Symbol, account type (C/O), quantity, price, market value
-    holdings_pattern = re.compile(
-        r'\b([A-Z]{2,5})\s+'  # Symbol (2-5 uppercase letters)
-        r'([CO])\s+'  # Account type (C=Cash, O=Other/On-loan)
-        r'([\d.]+)\s+'  # Quantity
-        r'\$?([\d,]+\.?\d*)\s+'  # Price
-        r'\$?([\d,]+\.?\d*)',  # Market value
-        re.MULTILINE
-    )
+    holdings_map = defaultdict(lambda: {"symbol": None, "name": None, "quantity": 0.0, "price": 0.0, "value": 0.0})
 
-    # Known valid symbols to avoid false positives
-    valid_symbols = {
-        "ARKK", "QQQ", "VUG", "VB", "VWO", "VOO", "VTI", "SPY", "IVV",
-        "SCHD", "VYM", "VXUS", "BND", "AGG", "VTIP", "VGSH", "VCIT",
-        "VNQ", "VGT", "VHT", "VDC", "VPU", "AAPL", "MSFT", "GOOGL",
-        "AMZN", "NVDA", "META", "TSLA", "BRK", "JPM", "V", "HD", "ISPAZ"
-    }
-
-    # Words that look like symbols but aren't
-    invalid_symbols = {"THE", "AND", "FOR", "ETF", "SER", "PAY", "REC", "DIV"}
-
-    for match in holdings_pattern.finditer(text):
+    for match in _HOLDINGS_RE.finditer(text):
         symbol = match.group(1)
 
-        # Skip invalid symbols
-        if symbol in invalid_symbols:
+        # Skip invalid symbols and FDIC deposits (ISPAZ is the sweep account)
+        if symbol in _INVALID_SYMBOLS or symbol == "ISPAZ":
             continue
 
         # Only accept known symbols or symbols that appear with reasonable values
@@ -204,36 +394,31 @@ def _extract_holdings_from_text(text: str, result: dict) -> None:
             continue
 
         # Additional check: only known symbols OR value > $100
-        if symbol not in valid_symbols and value < 100:
+        if symbol not in _VALID_SYMBOLS and value < 100:
             continue
 
         # Aggregate by symbol (handles C and O account types)
-        if symbol in holdings_map:
-            holdings_map[symbol]["quantity"] += quantity
-            holdings_map[symbol]["value"] += value
-        else:
-            holdings_map[symbol] = {
-                "symbol": symbol,
-                "name": _get_holding_name(symbol),
-                "quantity": quantity,
-                "price": price,  # Use price from first occurrence
-                "value": value,
-            }
+        holding = holdings_map[symbol]
+        if holding["symbol"] is None:
+            holding["symbol"] = symbol
+            holding["name"] = _HOLDING_NAMES.get(symbol, symbol)
+            holding["price"] = price  # Use price from first occurrence
+        holding["quantity"] += quantity
+        holding["value"] += value
 
     # Convert map to list and calculate percentages
-    total = result["portfolio"]["total_value"] or 1
-    for symbol, holding in holdings_map.items():
-        # Skip FDIC deposits (ISPAZ is the sweep account)
-        if symbol == "ISPAZ":
-            continue
-        result["portfolio"]["holdings"].append({
-            "symbol": holding["symbol"],
-            "name": holding["name"],
-            "quantity": round(holding["quantity"], 5),
-            "price": round(holding["price"], 2),
-            "value": round(holding["value"], 2),
-            "pct": round(holding["value"] / total * 100, 2)
-        })
+    inv_total = 100.0 / (result["portfolio"]["total_value"] or 1)
+    result["portfolio"]["holdings"].extend(
+        {
+            "symbol": h["symbol"],
+            "name": h["name"],
+            "quantity": round(h["quantity"], 5),
+            "price": round(h["price"], 2),
+            "value": round(h["value"], 2),
+            "pct": round(h["value"] * inv_total, 2),
+        }
+        for h in holdings_map.values()
+    )
 
 
 def _extract_retirement_info(text: str, result: dict) -> None:
@@ -241,7 +426,7 @@ def _extract_retirement_info(text: str, result: dict) -> None:
 
     # Look for contribution patterns
     # ROLLOVER CONTRIBUTION 2025 XX,XXX.XX
-    rollover_match = re.search(r'ROLLOVER CONTRIBUTION\s+(\d{4})\s+([\d,]+\.?\d*)', text)
+    rollover_match = _ROLLOVER_RE.search(text)
     if rollover_match:
         year = rollover_match.group(1)
         key = f"rollover_{year}"
@@ -249,7 +434,7 @@ def _extract_retirement_info(text: str, result: dict) -> None:
             result["retirement"][key] = _parse_money(rollover_match.group(2))
 
     # ROTH CONVERSION AMOUNT 2025 X,XXX.XX
-    conversion_match = re.search(r'ROTH CONVERSION AMOUNT\s+(\d{4})\s+([\d,]+\.?\d*)', text)
+    conversion_match = _CONV_RE.search(text)
     if conversion_match:
         year = conversion_match.group(1)
         key = f"roth_conversion_{year}"
@@ -257,7 +442,7 @@ def _extract_retirement_info(text: str, result: dict) -> None:
             result["retirement"][key] = _parse_money(conversion_match.group(2))
 
     # Regular contributions (but not ROLLOVER CONTRIBUTION - use negative lookbehind)
-    contrib_match = re.search(r'(?<!ROLLOVER )CONTRIBUTION\s+(\d{4})\s+([\d,]+\.?\d*)', text)
+    contrib_match = _CONTRIB_RE.search(text)
     if contrib_match:
         year = contrib_match.group(1)
         key = f"contribution_{year}"
@@ -270,9 +455,8 @@ def _parse_money(value: str) -> float:
     if not value:
         return 0.0
     try:
-        # Remove $ and commas
-        cleaned = str(value).replace("$", "").replace(",", "").strip()
-        return float(cleaned)
+        # Remove $ and commas; float() ignores surrounding whitespace
+        return float(value.translate(_MONEY_TABLE))
     except (ValueError, AttributeError):
         return 0.0
 
@@ -282,44 +466,30 @@ def _parse_number(value: str) -> Optional[float]:
     if not value:
         return None
     try:
-        cleaned = str(value).replace(",", "").strip()
-        return float(cleaned)
+        return float(value.translate(_NUMBER_TABLE))
     except (ValueError, AttributeError):
         return None
 
 
-def _get_holding_name(symbol: str) -> str:
-    """Get the full name for common symbols."""
-    names = {
-        "ARKK": "ARK Innovation ETF",
-        "QQQ": "Invesco QQQ Trust",
-        "VUG": "Vanguard Growth ETF",
-        "VB": "Vanguard Small-Cap ETF",
-        "VWO": "Vanguard FTSE Emerging Markets ETF",
-        "VOO": "Vanguard S&P 500 ETF",
-        "VTI": "Vanguard Total Stock Market ETF",
-        "SPY": "SPDR S&P 500 ETF",
-        "IVV": "iShares Core S&P 500 ETF",
-        "SCHD": "Schwab US Dividend Equity ETF",
-        "VYM": "Vanguard High Dividend Yield ETF",
-        "VXUS": "Vanguard Total International Stock ETF",
-        "BND": "Vanguard Total Bond Market ETF",
-        "AGG": "iShares Core US Aggregate Bond ETF",
-    }
-    return names.get(symbol, symbol)
-
-
 def is_sofi_apex_statement(pdf_path: str) -> bool:
     """Check if a PDF is a SoFi/Apex statement."""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if len(pdf.pages) < 1:
-                return False
-            first_page_text = pdf.pages[0].extract_text() or ""
-            # Look for Apex Clearing indicators
-            return "APEX" in first_page_text.upper() and (
-                "CLEARING" in first_page_text.upper() or
-                "SoFi" in first_page_text
-            )
+        n_pages, first_page_text = _statement_first_page(pdf_path)
     except Exception:
         return False
+    return n_pages > 0 and _is_sofi_apex_text(first_page_text)
+
+
+def is_sofi_apex_document(pdf) -> bool:
+    """Check if an open pdfplumber document is a SoFi/Apex statement."""
+    if len(pdf.pages) < 1:
+        return False
+    return _is_sofi_apex_text(pdf.pages[0].extract_text() or "")
+
+
+def _is_sofi_apex_text(first_page_text: str) -> bool:
+    """Check first-page text for Apex Clearing indicators."""
+    return "APEX" in first_page_text.upper() and (
+        "CLEARING" in first_page_text.upper() or
+        "SoFi" in first_page_text
+    )
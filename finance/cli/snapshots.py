@@ -5,13 +5,13 @@ Handles saving, loading, and querying financial statement snapshots.
 Supports both JSON file storage and PostgreSQL database.
 """
 
-import fcntl
-import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from config import DATA_DIR, SNAPSHOTS_DIR, LOCK_FILE, USE_DATABASE
+from config import DATA_DIR, SNAPSHOTS_DIR, USE_DATABASE
+from jsonio import JSONDecodeError, dumps, loads
 
 
 def ensure_dirs():
@@ -29,38 +29,56 @@ def _save_snapshot_json(data: dict) -> Path:
     filename = f"{date_str}_{account_type}.json"
     filepath = SNAPSHOTS_DIR / filename
 
-    LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(LOCK_FILE, "w") as lock_file:
-        fcntl.flock(lock_file, fcntl.LOCK_EX)
-        try:
-            temp_file = filepath.with_suffix(".json.tmp")
-            temp_file.write_text(json.dumps(data, indent=2))
-            temp_file.rename(filepath)
-        finally:
-            fcntl.flock(lock_file, fcntl.LOCK_UN)
+    # Filenames are unique per statement, so no lock is needed: each writer
+    # uses its own temp file and os.replace swaps it in atomically
+    temp_file = SNAPSHOTS_DIR / f".{filename}.{os.getpid()}.tmp"
+    payload = memoryview(dumps(data, indent=True).encode())
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write fewer bytes than asked; never rename a short file
+        while payload:
+            payload = payload[os.write(fd, payload):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_file, filepath)
 
     return filepath
 
 
 def _load_snapshots_json(account_type: Optional[str] = None) -> list:
     """Load snapshots from JSON files."""
-    ensure_dirs()
     snapshots = []
 
-    for filepath in sorted(SNAPSHOTS_DIR.glob("*.json")):
-        if filepath.name.startswith("."):
-            continue
-        try:
-            data = json.loads(filepath.read_text())
-            if account_type is None or data.get("account_type") == account_type:
-                data["_filepath"] = str(filepath)
-                snapshots.append(data)
-        except (json.JSONDecodeError, IOError):
-            continue
+    for path, data in _iter_snapshots_json():
+        if account_type is None or data.get("account_type") == account_type:
+            data["_filepath"] = path
+            snapshots.append(data)
 
     return snapshots
 
 
+def _iter_snapshots_json():
+    """Yield (path, data) for each readable JSON snapshot, in filename order."""
+    ensure_dirs()
+
+    # scandir avoids a Path object and stat() call per entry
+    with os.scandir(SNAPSHOTS_DIR) as it:
+        paths = [
+            entry.path for entry in it
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        ]
+    paths.sort()
+
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                data = loads(f.read())
+        except (JSONDecodeError, IOError):
+            continue
+        yield path, data
+
+
 def save_snapshot(data: dict) -> Path:
     """
     Save parsed statement data as a snapshot.
@@ -96,11 +114,11 @@ def load_snapshots(account_type: Optional[str] = None) -> list:
             for snap in snapshots:
                 # Convert JSONB fields back to dicts
                 if isinstance(snap.get("holdings"), str):
-                    snap["holdings"] = json.loads(snap["holdings"])
+                    snap["holdings"] = loads(snap["holdings"])
                 if isinstance(snap.get("income"), str):
-                    snap["income"] = json.loads(snap["income"])
+                    snap["income"] = loads(snap["income"])
                 if isinstance(snap.get("retirement"), str):
-                    snap["retirement"] = json.loads(snap["retirement"])
+                    snap["retirement"] = loads(snap["retirement"])
                 # Reconstruct portfolio structure
                 snap["portfolio"] = {
                     "total_value": float(snap.get("total_value", 0)),
@@ -124,6 +142,28 @@ def load_snapshots(account_type: Optional[str] = None) -> list:
     return _load_snapshots_json(account_type)
 
 
+def iter_snapshot_summaries(account_type: Optional[str] = None):
+    """
+    Yield (statement_date, account_type, total_value) for each snapshot.
+
+    Snapshots are parsed one at a time and only these fields are kept, so
+    listing history never holds the full snapshot set in memory.
+    """
+    if USE_DATABASE:
+        snapshots = load_snapshots(account_type)
+    else:
+        snapshots = (data for _, data in _iter_snapshots_json())
+
+    for snap in snapshots:
+        if account_type is not None and snap.get("account_type") != account_type:
+            continue
+        yield (
+            snap.get("statement_date"),
+            snap.get("account_type"),
+            (snap.get("portfolio") or {}).get("total_value", 0),
+        )
+
+
 def get_latest_snapshot(account_type: Optional[str] = None) -> Optional[dict]:
     """Get the most recent snapshot."""
     if USE_DATABASE:
@@ -133,7 +173,7 @@ def get_latest_snapshot(account_type: Optional[str] = None) -> Optional[dict]:
             if snap:
                 # Convert database format to JSON format
                 if isinstance(snap.get("holdings"), str):
-                    snap["holdings"] = json.loads(snap["holdings"])
+                    snap["holdings"] = loads(snap["holdings"])
                 snap["portfolio"] = {
                     "total_value": float(snap.get("total_value", 0)),
                     "securities_value": float(snap["securities_value"]) if snap.get("securities_value") else None,
@@ -146,6 +186,43 @@ def get_latest_snapshot(account_type: Optional[str] = None) -> Optional[dict]:
         except Exception as e:
             print(f"Warning: Failed to read from database, falling back to JSON: {e}")
 
+    return _latest_snapshot_json(account_type)
+
+
+def _latest_snapshot_json(account_type: Optional[str] = None) -> Optional[dict]:
+    """
+    Load the newest JSON snapshot without parsing the others.
+
+    Filenames are {date}_{account_type}.json, so the YYYY-MM-DD prefix
+    sorts in date order and the account type can be read from the name.
+    Snapshots sharing a date keep ascending filename order, matching the
+    stable statement_date sort used by the slow path.
+    """
+    ensure_dirs()
+    candidates = []
+    with os.scandir(SNAPSHOTS_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".json") or name.startswith("."):
+                continue
+            date_str, _, file_account = name[:-5].partition("_")
+            if not date_str[:1].isdigit():
+                # Snapshot saved without a statement date; needs the slow path
+                continue
+            if account_type is None or file_account == account_type:
+                candidates.append(name)
+
+    candidates.sort()
+    candidates.sort(key=lambda name: name.partition("_")[0], reverse=True)
+    for name in candidates:
+        path = SNAPSHOTS_DIR / name
+        try:
+            data = loads(path.read_bytes())
+        except (JSONDecodeError, IOError):
+            continue
+        data["_filepath"] = str(path)
+        return data
+
     snapshots = _load_snapshots_json(account_type)
     if not snapshots:
         return None
@@ -167,11 +244,11 @@ def get_latest_by_account_type() -> dict:
             # Convert database format to JSON format for each snapshot
             for account_type, snap in result.items():
                 if isinstance(snap.get("holdings"), str):
-                    snap["holdings"] = json.loads(snap["holdings"])
+                    snap["holdings"] = loads(snap["holdings"])
                 if isinstance(snap.get("income"), str):
-                    snap["income"] = json.loads(snap["income"])
+                    snap["income"] = loads(snap["income"])
                 if isinstance(snap.get("retirement"), str):
-                    snap["retirement"] = json.loads(snap["retirement"])
+                    snap["retirement"] = loads(snap["retirement"])
                 snap["portfolio"] = {
                     "total_value": float(snap.get("total_value", 0)),
                     "securities_value": float(snap["securities_value"]) if snap.get("securities_value") else None,
@@ -12,6 +12,30 @@ from colorama import Style
 from config import TEMPLATE_PATH, ACCOUNT_ROW_NAMES
 from formatting import format_header
 
+# An assets table: the "| Asset ... | Value |" header line plus every following
+# line up to the first blank line or "###" heading
+_ASSETS_TABLE_RE = re.compile(
+    r'^(?=[^\n]*\| Asset )(?=[^\n]*\| Value \|)[^\n]*(?:\n(?!###)[^\n]*\S[^\n]*)*',
+    re.MULTILINE
+)
+
+# A table row with at least three cells: (first cell) value cell (rest)
+_ROW_VALUE_RE = re.compile(r'^([^|\n]*\|[^|\n]*\|)[^|\n]*(\|[^\n]*)$', re.MULTILINE)
+
+
+def _replace_asset_values(content: str, latest_by_type: dict) -> str:
+    """Set the Value cell of each account row in the assets tables."""
+
+    def replace_row(match):
+        line = match.group(0)
+        for account_type, row_name in ACCOUNT_ROW_NAMES.items():
+            if row_name in line and account_type in latest_by_type:
+                value = latest_by_type[account_type]["portfolio"]["total_value"]
+                return f"{match.group(1)} ${value:,.2f} {match.group(2)}"
+        return line
+
+    return _ASSETS_TABLE_RE.sub(lambda table: _ROW_VALUE_RE.sub(replace_row, table.group(0)), content)
+
 
 def update_template(data: dict, all_snapshots: list = None) -> bool:
     """
@@ -44,29 +68,7 @@ def update_template(data: dict, all_snapshots: list = None) -> bool:
         if account_type:
             latest_by_type[account_type] = snap
 
-    lines = content.split("\n")
-    updated_lines = []
-    in_assets_table = False
-
-    for line in lines:
-        if "| Asset " in line and "| Value |" in line:
-            in_assets_table = True
-        elif in_assets_table and (line.strip() == "" or line.startswith("###")):
-            in_assets_table = False
-
-        if in_assets_table and "|" in line:
-            for account_type, row_name in ACCOUNT_ROW_NAMES.items():
-                if row_name in line and account_type in latest_by_type:
-                    parts = line.split("|")
-                    if len(parts) >= 4:
-                        value = latest_by_type[account_type]["portfolio"]["total_value"]
-                        parts[2] = f" ${value:,.2f} "
-                        line = "|".join(parts)
-                    break
-
-        updated_lines.append(line)
-
-    new_content = "\n".join(updated_lines)
+    new_content = _replace_asset_values(content, latest_by_type)
 
     temp_file = TEMPLATE_PATH.with_suffix(".md.tmp")
     temp_file.write_text(new_content)
@@ -95,29 +97,7 @@ def populate_template(template: str, latest_by_type: dict) -> str:
         content
     )
 
-    lines = content.split("\n")
-    updated_lines = []
-    in_assets_table = False
-
-    for line in lines:
-        if "| Asset " in line and "| Value |" in line:
-            in_assets_table = True
-        elif in_assets_table and (line.strip() == "" or line.startswith("###")):
-            in_assets_table = False
-
-        if in_assets_table and "|" in line:
-            for account_type, row_name in ACCOUNT_ROW_NAMES.items():
-                if row_name in line and account_type in latest_by_type:
-                    parts = line.split("|")
-                    if len(parts) >= 4:
-                        value = latest_by_type[account_type]["portfolio"]["total_value"]
-                        parts[2] = f" ${value:,.2f} "
-                        line = "|".join(parts)
-                    break
-
-        updated_lines.append(line)
-
-    return "\n".join(updated_lines)
+    return _replace_asset_values(content, latest_by_type)
 
 
 def populate_cash_flow(content: str, profile: dict) -> str:
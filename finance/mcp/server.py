@@ -2,26 +2,123 @@
 """
 Finance MCP Server - Parse brokerage statements and manage financial planning.
 
-This server bridges to the finance CLI tool for all operations.
+This server bridges to the finance CLI tool for all operations. The CLI is
+imported and run in-process when possible, falling back to finance.sh.
 """
 
+import asyncio
+import importlib.util
+import io
 import json
 import subprocess
+import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+    _loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+
 # Initialize MCP server
 mcp = FastMCP("finance")
 
 # Path to CLI tool
 # finance/mcp/server.py -> mcp -> finance -> finance.sh
 CLI_PATH = Path(__file__).resolve().parent.parent / "finance.sh"
+CLI_DIR = Path(__file__).resolve().parent.parent / "cli"
+
+# In-process CLI module: None = not loaded yet, False = unavailable (use subprocess)
+_cli_module = None
+
+# Stream redirection is process-wide, so in-process CLI calls must not overlap
+_cli_lock = threading.Lock()
+
+
+def _load_cli():
+    """Import finance/cli/finance.py in-process, or return None if it can't be loaded."""
+    global _cli_module
+    if _cli_module is None:
+        try:
+            spec = importlib.util.spec_from_file_location("finance_cli", CLI_DIR / "finance.py")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _cli_module = module
+        except Exception as e:
+            print(f"[finance-mcp] In-process CLI unavailable, using subprocess: {e}", file=sys.__stderr__)
+            _cli_module = False
+    return _cli_module or None
 
 
-def call_cli(*args) -> dict:
+async def call_cli(*args) -> dict:
+    """Call the finance CLI off the event loop and return parsed JSON output.
+
+    This only keeps the event loop responsive while a call runs; in-process
+    calls still run one at a time under _cli_lock.
+    """
+    return await asyncio.to_thread(_blocking_call_cli, *args)
+
+
+def _blocking_call_cli(*args) -> dict:
     """Call the finance CLI and return parsed JSON output."""
+    output = io.StringIO()
+    errors = io.StringIO()
+    try:
+        with _cli_lock, redirect_stdout(output), redirect_stderr(errors):
+            # Loaded under the redirect so import-time side effects never touch the stdio transport
+            cli = _load_cli()
+            exit_code = 0
+            if cli is not None:
+                try:
+                    exit_code = cli.main([*args, "--json"]) or 0
+                except SystemExit as e:
+                    # Same convention as the interpreter: None is success, an
+                    # int is the status, anything else is a message and status 1
+                    if isinstance(e.code, int) or e.code is None:
+                        exit_code = e.code or 0
+                    else:
+                        errors.write(str(e.code))
+                        exit_code = 1
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    if cli is None:
+        return _call_cli_subprocess(*args)
+
+    return _cli_result(output.getvalue(), errors.getvalue(), exit_code)
+
+
+def _cli_result(stdout: str, stderr: str, exit_code: int) -> dict:
+    """Build a tool result from the CLI's output and exit status."""
+    data = None
+    if stdout.strip():
+        try:
+            data = _loads(stdout)
+        except json.JSONDecodeError as e:
+            if exit_code == 0:
+                return {"success": False, "error": f"Failed to parse CLI output: {e}"}
+
+    if exit_code != 0:
+        # Keep the CLI's own JSON error if it printed one
+        if isinstance(data, dict) and data.get("success") is False:
+            return data
+        return {
+            "success": False,
+            "error": stderr.strip() or f"CLI exited with status {exit_code}"
+        }
+
+    if data is None:
+        return {"success": False, "error": stderr or "No output from CLI"}
+    return data
+
+
+def _call_cli_subprocess(*args) -> dict:
+    """Call the finance CLI via finance.sh and return parsed JSON output."""
     cmd = [str(CLI_PATH), *args, "--json"]
     try:
         result = subprocess.run(
@@ -30,17 +127,9 @@ def call_cli(*args) -> dict:
             text=True,
             timeout=60
         )
-        if result.stdout.strip():
-            return json.loads(result.stdout)
-        else:
-            return {
-                "success": False,
-                "error": result.stderr or "No output from CLI"
-            }
+        return _cli_result(result.stdout, result.stderr, result.returncode)
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "Command timed out"}
-    except json.JSONDecodeError as e:
-        return {"success": False, "error": f"Failed to parse CLI output: {e}"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -67,7 +156,7 @@ async def parse_statement(
     args = ["parse", filename]
     if no_update:
         args.append("--no-update")
-    return call_cli(*args)
+    return await call_cli(*args)
 
 
 @mcp.tool()
@@ -89,7 +178,7 @@ async def get_finance_history(
     args = ["history"]
     if account:
         args.extend(["--account", account])
-    return call_cli(*args)
+    return await call_cli(*args)
 
 
 @mcp.tool()
@@ -102,7 +191,7 @@ async def get_finance_summary() -> dict:
         - success: True/False
         - data: Latest snapshot data including portfolio, holdings, and income
     """
-    return call_cli("summary")
+    return await call_cli("summary")
 
 
 @mcp.tool()
@@ -133,7 +222,7 @@ async def pull_statement(
         args.append("--latest")
     if no_update:
         args.append("--no-update")
-    return call_cli(*args)
+    return await call_cli(*args)
 
 
 @mcp.tool()
@@ -156,7 +245,7 @@ async def generate_planning_prompt() -> dict:
         - accounts_included: List of account types in the prompt
         - as_of_dates: Dict of account_type -> statement date
     """
-    return call_cli("plan")
+    return await call_cli("plan")
 
 
 @mcp.tool()
@@ -176,7 +265,7 @@ async def get_holdings() -> dict:
         - total_value: Sum of all holdings
         - last_updated: When holdings were last manually updated
     """
-    return call_cli("holdings")
+    return await call_cli("holdings")
 
 
 @mcp.tool()
@@ -206,7 +295,7 @@ async def set_holding(
     args = ["holdings", "set", path, str(value)]
     if notes:
         args.extend(["--notes", notes])
-    return call_cli(*args)
+    return await call_cli(*args)
 
 
 @mcp.tool()
@@ -225,7 +314,7 @@ async def check_holdings_freshness() -> dict:
         - days_since_update: Number of days since last update
         - message: Human-readable status message
     """
-    return call_cli("holdings", "check")
+    return await call_cli("holdings", "check")
 
 
 @mcp.tool()
@@ -260,7 +349,7 @@ async def get_portfolio(include_prices: bool = True) -> dict:
     args = ["portfolio"]
     if not include_prices:
         args.append("--no-prices")
-    return call_cli(*args)
+    return await call_cli(*args)
 
 
 @mcp.tool()
@@ -306,7 +395,7 @@ async def get_financial_advice(focus: str = "all") -> dict:
     args = ["advise"]
     if focus and focus != "all":
         args.extend(["--focus", focus])
-    return call_cli(*args)
+    return await call_cli(*args)
 
 
 if __name__ == "__main__":